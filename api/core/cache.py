@@ -0,0 +1,74 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Size-bounded LRU cache whose entries expire after `ttl` seconds.
+
+    `on_evict` is called with the key and value of every entry that is
+    dropped by expiry, by the size bound or by being overwritten, but not
+    for entries removed with `pop`.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[K, V], None]] = None,
+    ):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._on_evict = on_evict
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self._evicted(key, value)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        expires_at = (
+            time.monotonic() + self._ttl if self._ttl is not None else float("inf")
+        )
+        previous = self._entries.get(key)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if previous is not None and previous[1] is not value:
+            self._evicted(key, previous[1])
+        while len(self._entries) > self._max_size:
+            evicted_key, (_, evicted_value) = self._entries.popitem(last=False)
+            self._evicted(evicted_key, evicted_value)
+
+    def _evicted(self, key: K, value: V) -> None:
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def pop(self, key: K) -> Optional[V]:
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def keys(self) -> list[K]:
+        return list(self._entries.keys())
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] >= time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,124 @@
+import asyncio
+import time
+from datetime import timedelta
+from typing import Optional
+
+import structlog
+from psycopg_pool import AsyncConnectionPool
+
+
+class CheckpointRetention:
+    """Keeps the Postgres checkpoint tables bounded to recent sessions.
+
+    Each upload resets its thread with one function call that also records
+    the session start in `checkpoint_threads`. A background sweeper expires
+    threads older than `ttl` in batches of `batch_size`, one short
+    transaction per batch, until a batch comes back short.
+    """
+
+    STATS_QUERY = """
+        SELECT COUNT(*), EXTRACT(EPOCH FROM NOW() - MIN(created_at))
+        FROM chapchap.checkpoint_threads
+    """
+
+    def __init__(
+        self,
+        db_pool: AsyncConnectionPool,
+        ttl: float,
+        batch_size: int,
+        sweep_interval: float,
+    ):
+        self.logger = structlog.stdlib.get_logger("checkpoint_retention")
+        self._db_pool = db_pool
+        self._ttl = timedelta(seconds=ttl)
+        self._batch_size = batch_size
+        self._sweep_interval = sweep_interval
+        self._sweep_task: Optional[asyncio.Task] = None
+        self._metrics = {
+            "thread_count": None,
+            "oldest_thread_age_seconds": None,
+            "expired_total": 0,
+            "resets_total": 0,
+            "sweeps_total": 0,
+            "sweep_failures_total": 0,
+            "last_sweep_expired": None,
+            "last_sweep_duration_ms": None,
+            "last_sweep_at": None,
+        }
+
+    @classmethod
+    def create(
+        cls,
+        db_pool: AsyncConnectionPool,
+        ttl: float,
+        batch_size: int,
+        sweep_interval: float,
+    ) -> "CheckpointRetention":
+        retention = cls(db_pool, ttl, batch_size, sweep_interval)
+        retention._sweep_task = asyncio.create_task(retention._sweep_loop())
+        return retention
+
+    async def reset_thread(self, thread_id: str) -> None:
+        async with self._db_pool.connection() as conn:
+            await conn.execute(
+                "SELECT chapchap.reset_checkpoint_thread(%s)", (thread_id,)
+            )
+        self._metrics["resets_total"] += 1
+
+    async def sweep(self) -> int:
+        start_time = time.perf_counter()
+        expired = 0
+        async with self._db_pool.connection() as conn:
+            while True:
+                # autocommit 연결이므로 배치마다 커밋되어 락이 짧게 유지됨
+                cur = await conn.execute(
+                    "SELECT chapchap.expire_checkpoint_threads(%s, %s)",
+                    (self._ttl, self._batch_size),
+                )
+                batch_expired = (await cur.fetchone())[0]
+                expired += batch_expired
+                if batch_expired < self._batch_size:
+                    break
+            cur = await conn.execute(self.STATS_QUERY)
+            thread_count, oldest_age = await cur.fetchone()
+
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 1)
+        self._metrics.update(
+            {
+                "thread_count": thread_count,
+                "oldest_thread_age_seconds": (
+                    float(oldest_age) if oldest_age is not None else None
+                ),
+                "expired_total": self._metrics["expired_total"] + expired,
+                "sweeps_total": self._metrics["sweeps_total"] + 1,
+                "last_sweep_expired": expired,
+                "last_sweep_duration_ms": duration_ms,
+                "last_sweep_at": time.time(),
+            }
+        )
+        self.logger.info(
+            "checkpoint_sweep_finished",
+            expired=expired,
+            thread_count=thread_count,
+            duration_ms=duration_ms,
+        )
+        return expired
+
+    def metrics(self) -> dict:
+        return {
+            "ttl_seconds": self._ttl.total_seconds(),
+            **self._metrics,
+        }
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                self._metrics["sweep_failures_total"] += 1
+                self.logger.error("checkpoint_sweep_failed", error=str(e))
+            await asyncio.sleep(self._sweep_interval)
+
+    async def close(self) -> None:
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
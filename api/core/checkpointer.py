@@ -0,0 +1,197 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+import structlog
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+class TTLMemorySaver(InMemorySaver):
+    """In-memory checkpointer for short-lived sessions.
+
+    Threads expire `ttl` seconds after their last read or write, and the
+    least recently used thread is dropped beyond `max_threads`. With a
+    `durable` saver every write is queued and replayed to it by a background
+    task, so a session survives a restart without the request path waiting
+    on Postgres. A thread missing from memory is then restored from the
+    durable saver on first read.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_threads: int,
+        durable: Optional[BaseCheckpointSaver] = None,
+        flush_interval: float = 1.0,
+    ):
+        super().__init__()
+        self.logger = structlog.stdlib.get_logger("checkpointer")
+        self._ttl = ttl
+        self._max_threads = max_threads
+        self._last_access: OrderedDict[str, float] = OrderedDict()
+        self._durable = durable
+        self._flush_interval = flush_interval
+        self._queue: list[tuple[str, str, tuple]] = []
+        # flush가 내보내는 중인 쓰기로, forget과 flush는 _flush_lock 아래에서만 수정
+        self._in_flight: list[tuple[str, str, tuple]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        if durable is not None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def _touch(self, thread_id: str) -> None:
+        now = time.monotonic()
+        self._last_access[thread_id] = now
+        self._last_access.move_to_end(thread_id)
+        # 접근 순서로 정렬되어 있으므로 앞쪽의 만료된 스레드만 확인하면 됨
+        while self._last_access:
+            oldest, last_access = next(iter(self._last_access.items()))
+            if oldest == thread_id:
+                break
+            if (
+                now - last_access <= self._ttl
+                and len(self._last_access) <= self._max_threads
+            ):
+                break
+            self._evict(oldest)
+
+    def _evict(self, thread_id: str) -> None:
+        self._last_access.pop(thread_id, None)
+        super().delete_thread(thread_id)
+
+    async def forget(self, thread_id: str) -> None:
+        """Drop a thread from memory along with its unflushed writes.
+
+        Takes the flush lock, so it waits for at most the one write that is
+        being sent and no later write of the thread reaches the durable saver.
+        """
+        self._evict(thread_id)
+        async with self._flush_lock:
+            self._queue = [op for op in self._queue if op[1] != thread_id]
+            self._in_flight = [op for op in self._in_flight if op[1] != thread_id]
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        last_access = self._last_access.get(thread_id)
+        if last_access is not None and time.monotonic() - last_access > self._ttl:
+            self._evict(thread_id)
+        checkpoint_tuple = self.get_tuple(config)
+        if checkpoint_tuple is None and self._durable is not None:
+            checkpoint_tuple = await self._restore(config)
+        if checkpoint_tuple is not None:
+            self._touch(thread_id)
+        elif not any(self.storage.get(thread_id, {}).values()):
+            # storage는 defaultdict라 조회만 해도 빈 항목이 생기므로 정리
+            self.storage.pop(thread_id, None)
+        return checkpoint_tuple
+
+    async def _restore(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        checkpoint_tuple = await self._durable.aget_tuple(config)
+        if checkpoint_tuple is None:
+            return None
+        # 모든 채널 값을 새 버전으로 기록해야 메모리에서 상태를 다시 읽을 수 있음
+        checkpoint = checkpoint_tuple.checkpoint
+        stored_config = super().put(
+            checkpoint_tuple.parent_config
+            or {
+                "configurable": {
+                    "thread_id": config["configurable"]["thread_id"],
+                    "checkpoint_ns": checkpoint_tuple.config["configurable"].get(
+                        "checkpoint_ns", ""
+                    ),
+                }
+            },
+            {**checkpoint, "pending_sends": checkpoint.get("pending_sends", [])},
+            checkpoint_tuple.metadata,
+            checkpoint["channel_versions"],
+        )
+        pending_by_task: dict[str, list[tuple[str, Any]]] = {}
+        for task_id, channel, value in checkpoint_tuple.pending_writes or []:
+            pending_by_task.setdefault(task_id, []).append((channel, value))
+        for task_id, writes in pending_by_task.items():
+            super().put_writes(stored_config, writes, task_id)
+        self.logger.info(
+            "checkpoint_restored", thread_id=config["configurable"]["thread_id"]
+        )
+        return self.get_tuple(config)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        self._touch(thread_id)
+        if self._durable is not None:
+            self._queue.append(
+                ("aput", thread_id, (config, checkpoint, metadata, new_versions))
+            )
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        self._touch(thread_id)
+        if self._durable is not None:
+            self._queue.append(
+                ("aput_writes", thread_id, (config, writes, task_id, task_path))
+            )
+        return self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self.forget(thread_id)
+        if self._durable is not None:
+            await self._durable.adelete_thread(thread_id)
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            # 취소 등으로 남은 쓰기가 있으면 그 뒤에 이어 붙여 순서를 유지
+            self._in_flight.extend(self._queue)
+            self._queue = []
+        write_count = 0
+        while True:
+            # 쓰기마다 락을 다시 잡아 forget이 사이에 남은 쓰기를 지울 수 있게 함
+            async with self._flush_lock:
+                if not self._in_flight:
+                    break
+                method, _, args = self._in_flight[0]
+                try:
+                    await getattr(self._durable, method)(*args)
+                except Exception:
+                    # 순서가 중요하므로 실패한 쓰기부터 다음 주기에 다시 시도
+                    self._queue = self._in_flight + self._queue
+                    self._in_flight = []
+                    raise
+                self._in_flight.pop(0)
+                write_count += 1
+        if write_count:
+            self.logger.debug("checkpoint_flushed", write_count=write_count)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                self.logger.error("checkpoint_flush_failed", error=str(e))
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await self.flush()
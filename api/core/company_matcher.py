@@ -0,0 +1,141 @@
+import asyncio
+from collections import deque
+from typing import Iterable, Optional
+
+import structlog
+from psycopg_pool import AsyncConnectionPool
+
+from core.config import settings
+
+
+class AhoCorasick:
+    """Multi-pattern automaton mapping every matched pattern to its company ids.
+
+    Outputs are merged along failure links at build time, so a search is a
+    single linear scan over the text regardless of the number of patterns.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, int]]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[frozenset[int]] = []
+        outputs: list[set[int]] = [set()]
+
+        for pattern, company_id in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(company_id)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._out = [frozenset(output) for output in outputs]
+
+    def search(self, text: str) -> set[int]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found |= out[state]
+        return found
+
+
+class CompanyNameMatcher:
+    """Cached company name dictionary for named experience detection.
+
+    Company names and their alternate names are loaded once into an
+    Aho-Corasick automaton and reloaded in the background whenever the
+    `companies` or `company_alternate_names` tables change.
+    """
+
+    NAMES_QUERY = """
+        SELECT c.id AS company_id, c.name AS name_variant
+        FROM chapchap.companies c
+        UNION ALL
+        SELECT can.company_id, can.alternate_name AS name_variant
+        FROM chapchap.company_alternate_names can
+    """
+
+    # 이름 변경처럼 개수가 그대로인 수정도 감지하도록 내용 전체의 해시를 비교
+    VERSION_QUERY = """
+        SELECT
+            (
+                SELECT md5(COALESCE(string_agg(id || ':' || name, ',' ORDER BY id), ''))
+                FROM chapchap.companies
+            ),
+            (
+                SELECT md5(COALESCE(string_agg(
+                    company_id || ':' || alternate_name, ','
+                    ORDER BY company_id, alternate_name
+                ), ''))
+                FROM chapchap.company_alternate_names
+            )
+    """
+
+    def __init__(self, db_pool: AsyncConnectionPool):
+        self.logger = structlog.stdlib.get_logger("company_matcher")
+        self._db_pool = db_pool
+        self._automaton = AhoCorasick([])
+        self._version: Optional[tuple] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def create(cls, db_pool: AsyncConnectionPool) -> "CompanyNameMatcher":
+        matcher = cls(db_pool)
+        await matcher.refresh()
+        matcher._refresh_task = asyncio.create_task(matcher._refresh_loop())
+        return matcher
+
+    def find(self, full_text: str) -> list[int]:
+        return sorted(self._automaton.search(full_text.lower()))
+
+    async def refresh(self) -> None:
+        async with self._db_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self.VERSION_QUERY)
+                version = await cur.fetchone()
+                if version == self._version:
+                    return
+                await cur.execute(self.NAMES_QUERY)
+                rows = await cur.fetchall()
+
+        # 오토마톤은 새로 만들어 한 번에 교체하므로 검색 중인 요청에 영향이 없음
+        self._automaton = AhoCorasick(
+            (name_variant.lower(), company_id) for company_id, name_variant in rows
+        )
+        self._version = version
+        self.logger.info("company_matcher_refreshed", name_count=len(rows))
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.COMPANY_MATCHER_REFRESH_INTERVAL)
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.logger.error("company_matcher_refresh_failed", error=str(e))
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
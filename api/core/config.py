@@ -104,24 +104,92 @@ class Settings:
             os.getenv("POSTGRES_CONNECTION_MAX_IDLE", "120")
         )
 
+        # Snapshot Cache Settings
+        self.SNAPSHOT_VERSION_CHECK_INTERVAL = float(
+            os.getenv("SNAPSHOT_VERSION_CHECK_INTERVAL", "10")
+        )
+
+        # Company Matcher Settings
+        self.COMPANY_MATCHER_REFRESH_INTERVAL = float(
+            os.getenv("COMPANY_MATCHER_REFRESH_INTERVAL", "300")
+        )
+
+        # Resume Extraction Settings
+        self.RESUME_EXTRACT_WORKERS = int(os.getenv("RESUME_EXTRACT_WORKERS", "2"))
+        self.RESUME_MAX_BYTES = int(
+            os.getenv("RESUME_MAX_BYTES", str(10 * 1024 * 1024))
+        )
+        self.RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "30"))
+        self.RESUME_PAGES_PER_TASK = int(os.getenv("RESUME_PAGES_PER_TASK", "5"))
+
+        # Job Listing Pagination Settings
+        self.JOB_PAGE_SIZE = int(os.getenv("JOB_PAGE_SIZE", "20"))
+        self.JOB_PAGE_MAX_SIZE = int(os.getenv("JOB_PAGE_MAX_SIZE", "100"))
+
         # LLM Settings
         self.LLM_MODEL = os.getenv("LLM_MODEL", "google_genai:gemini-2.0-flash")
         self.DEFAULT_LLM_TEMPERATURE = float(
             os.getenv("DEFAULT_LLM_TEMPERATURE", "0.2")
         )
         self.LLM_DB_POOL_SIZE = int(os.getenv("LLM_DB_POOL_SIZE", "10"))
-        self.CHECKPOINT_TABLES = [
-            "checkpoint_blobs",
-            "checkpoint_writes",
-            "checkpoints",
-        ]
+        # "postgres" 또는 "memory"
+        self.CHECKPOINTER = os.getenv("CHECKPOINTER", "postgres").lower()
+        self.CHECKPOINT_TTL = float(os.getenv("CHECKPOINT_TTL", "3600"))
+        self.CHECKPOINT_MAX_THREADS = int(os.getenv("CHECKPOINT_MAX_THREADS", "5000"))
+        self.CHECKPOINT_WRITE_THROUGH = os.getenv(
+            "CHECKPOINT_WRITE_THROUGH", "false"
+        ).lower() in ("true", "1", "t", "yes")
+        self.CHECKPOINT_FLUSH_INTERVAL = float(
+            os.getenv("CHECKPOINT_FLUSH_INTERVAL", "1")
+        )
+        self.CHECKPOINT_RETENTION_TTL = float(
+            os.getenv("CHECKPOINT_RETENTION_TTL", "86400")
+        )
+        self.CHECKPOINT_SWEEP_BATCH_SIZE = int(
+            os.getenv("CHECKPOINT_SWEEP_BATCH_SIZE", "100")
+        )
+        self.CHECKPOINT_SWEEP_INTERVAL = float(
+            os.getenv("CHECKPOINT_SWEEP_INTERVAL", "300")
+        )
         self.OPENAI_EMBEDDING_MODEL = os.getenv(
             "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
         )
+        self.EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "50000"))
+        self.SUMMARY_EMBED_BATCH_SIZE = int(os.getenv("SUMMARY_EMBED_BATCH_SIZE", "4"))
         self.DONE_TOKEN = "[[DONE]]"
+        self.SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "1000"))
+        self.SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", "86400"))
 
         self.RETRIEVAL_COUNT = int(os.getenv("RETRIEVAL_COUNT", "10"))
+        self.HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "40"))
+        self.HNSW_MAX_EF_SEARCH = int(os.getenv("HNSW_MAX_EF_SEARCH", "1000"))
+        self.VECTOR_INDEX_ENABLED = os.getenv(
+            "VECTOR_INDEX_ENABLED", "true"
+        ).lower() in ("true", "1", "t", "yes")
+        self.VECTOR_INDEX_REFRESH_INTERVAL = float(
+            os.getenv("VECTOR_INDEX_REFRESH_INTERVAL", "60")
+        )
+        self.MAXSIM_ENABLED = os.getenv("MAXSIM_ENABLED", "true").lower() in (
+            "true",
+            "1",
+            "t",
+            "yes",
+        )
+        self.MAXSIM_CANDIDATE_COUNT = int(os.getenv("MAXSIM_CANDIDATE_COUNT", "200"))
         self.RERANK_COUNT = int(os.getenv("RERANK_COUNT", "10"))
+        self.MATCH_PRECOMPUTE_ENABLED = os.getenv(
+            "MATCH_PRECOMPUTE_ENABLED", "true"
+        ).lower() in ("true", "1", "t", "yes")
+        self.MATCH_RUN_CACHE_SIZE = int(os.getenv("MATCH_RUN_CACHE_SIZE", "1000"))
+        self.MATCH_RUN_TTL = float(os.getenv("MATCH_RUN_TTL", "1800"))
+        self.RERANK_TOKEN_BUDGET = int(os.getenv("RERANK_TOKEN_BUDGET", "6000"))
+        self.RERANK_MAX_QUALIFICATIONS = int(
+            os.getenv("RERANK_MAX_QUALIFICATIONS", "4")
+        )
+        self.RERANK_MAX_RESPONSIBILITIES = int(
+            os.getenv("RERANK_MAX_RESPONSIBILITIES", "3")
+        )
+        self.RERANK_TEAM_INFO_CHARS = int(os.getenv("RERANK_TEAM_INFO_CHARS", "200"))
 
 
 # Create settings instance
@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, List
+
+import numpy as np
+import structlog
+from psycopg_pool import AsyncConnectionPool
+
+from core.cache import TTLCache
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache keyed by (model, sentence hash).
+
+    Tier one is an in-process LRU, tier two the `embedding_cache` table with
+    vectors stored as packed float32 bytes. Only sentences missing from both
+    tiers are sent to the embedding API, in a single batched call. Sentences
+    already being fetched by another caller are joined instead of requested
+    twice.
+    """
+
+    def __init__(
+        self,
+        db_pool: AsyncConnectionPool,
+        embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+        model: str,
+        max_size: int,
+    ):
+        self.logger = structlog.stdlib.get_logger("embedding_cache")
+        self._db_pool = db_pool
+        self._embed = embed
+        self._model = model
+        self._memory: TTLCache[str, np.ndarray] = TTLCache(max_size=max_size)
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        hashes = [text_hash(text) for text in texts]
+        found: dict[str, np.ndarray] = {}
+        waiting: dict[str, asyncio.Task] = {}
+        owned: dict[str, str] = {}
+        for key, text in zip(hashes, texts):
+            if key in found or key in waiting or key in owned:
+                continue
+            vector = self._memory.get(key)
+            if vector is not None:
+                found[key] = vector
+            elif key in self._inflight:
+                # 다른 요청이 이미 가져오는 중인 문장은 그 결과를 기다림
+                waiting[key] = self._inflight[key]
+            else:
+                owned[key] = text
+
+        if owned:
+            task = asyncio.ensure_future(self._fetch(owned))
+            for key in owned:
+                self._inflight[key] = task
+            try:
+                found.update(await asyncio.shield(task))
+            finally:
+                for key in owned:
+                    if self._inflight.get(key) is task:
+                        del self._inflight[key]
+
+        for key, task in waiting.items():
+            found[key] = (await asyncio.shield(task))[key]
+
+        self.logger.info(
+            "embedding_cache_lookup",
+            total=len(texts),
+            joined=len(waiting),
+        )
+        return [found[key] for key in hashes]
+
+    async def _fetch(self, texts_by_hash: dict[str, str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        async with self._db_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                        SELECT text_hash, embedding
+                        FROM chapchap.embedding_cache
+                        WHERE model = %s AND text_hash = ANY(%s)
+                    """,
+                    (self._model, list(texts_by_hash.keys())),
+                )
+                for key, embedding in await cur.fetchall():
+                    vector = np.frombuffer(embedding, dtype=np.float32)
+                    found[key] = vector
+                    self._memory.set(key, vector)
+
+        miss_texts = {
+            key: text for key, text in texts_by_hash.items() if key not in found
+        }
+        if miss_texts:
+            embeddings = await self._embed(list(miss_texts.values()))
+            rows = []
+            for key, embedding in zip(miss_texts.keys(), embeddings):
+                vector = np.asarray(embedding, dtype=np.float32)
+                found[key] = vector
+                self._memory.set(key, vector)
+                rows.append((self._model, key, vector.tobytes()))
+
+            async with self._db_pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.executemany(
+                        """
+                            INSERT INTO chapchap.embedding_cache
+                                (model, text_hash, embedding)
+                            VALUES (%s, %s, %s)
+                            ON CONFLICT DO NOTHING
+                        """,
+                        rows,
+                    )
+
+        self.logger.info(
+            "embedding_cache_fetch",
+            total=len(texts_by_hash),
+            api_requests=len(miss_texts),
+        )
+        return found
@@ -1,27 +1,131 @@
 from langchain.chat_models import init_chat_model
 from core.config import settings
-from typing import Optional, AsyncGenerator, Annotated, Literal
+from typing import Optional, AsyncGenerator, Annotated, Awaitable, Callable, Literal
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.graph.state import CompiledStateGraph
 import structlog
 from typing_extensions import TypedDict
 from langgraph.graph import END
+from langgraph.config import get_stream_writer
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from psycopg_pool import AsyncConnectionPool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from openai import AsyncOpenAI
 from typing import List
 import numpy as np
 from psycopg.rows import dict_row
-from collections import defaultdict
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_google_genai import ChatGoogleGenerativeAI
 from core.prompts import rerank_job_prompt, cover_letter_prompt, resume_summary_prompt
+from core.cache import TTLCache
+from core.checkpointer import TTLMemorySaver
+from core.checkpoint_retention import CheckpointRetention
+from core.match_run import MatchRun
+from core.embedding_cache import EmbeddingCache
+from core.vector_index import JobVectorIndex
+from core.rerank_context import build_rerank_context, estimate_tokens
+import asyncio
+import hashlib
 
+# 프롬프트나 모델이 바뀌면 요약 캐시가 자동으로 무효화되도록 키에 포함
+SUMMARY_PROMPT_VERSION = hashlib.sha256(
+    (resume_summary_prompt() + settings.LLM_MODEL).encode()
+).hexdigest()[:16]
 
-class JobMatch(TypedDict):
-    job_id: int
-    distance: float
+
+def parse_summary_line(line: str) -> Optional[str]:
+    if not (line.strip() and line.startswith("- ")):
+        return None
+    # "- "만 있는 빈 항목은 문장으로 취급하지 않음
+    return line.strip()[1:].strip().replace(" -> ", ", ").strip() or None
+
+
+def parse_summary_sentences(summary: str) -> list[str]:
+    sentences = [parse_summary_line(line) for line in summary.strip().split("\n")]
+    return [sentence for sentence in sentences if sentence is not None]
+
+
+def summary_cache_key(resume_text: str) -> str:
+    # 라우터가 이미 소문자로 바꾼 텍스트를 받으므로 공백만 정규화
+    normalized = " ".join(resume_text.split())
+    return hashlib.sha256(f"{SUMMARY_PROMPT_VERSION}:{normalized}".encode()).hexdigest()
+
+
+class SummaryEmbeddingPrefetcher:
+    """Embeds summary sentences while the summary is still streaming.
+
+    Every completed "- " line is queued and each full batch is sent to the
+    embedding cache right away, so the round trips overlap with generation.
+    `_retrieve_matches` later asks for the same sentences and joins the cached or
+    in-flight results.
+    """
+
+    def __init__(
+        self,
+        get_embeddings: Callable[[List[str]], Awaitable[list]],
+        batch_size: int,
+    ):
+        self.logger = structlog.stdlib.get_logger("graph")
+        self._get_embeddings = get_embeddings
+        self._batch_size = batch_size
+        self._buffer = ""
+        self._seen_content = False
+        self._pending: list[str] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def feed(self, chunk: str) -> None:
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._add_line(line)
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+
+    def finish(self) -> None:
+        self._add_line(self._buffer)
+        self._buffer = ""
+        self._flush()
+
+    def _add_line(self, line: str) -> None:
+        # parse_summary_sentences와 같은 결과가 나오도록 첫 줄의 앞 공백만 제거
+        if not self._seen_content:
+            if not line.strip():
+                return
+            line = line.lstrip()
+            self._seen_content = True
+        sentence = parse_summary_line(line)
+        if sentence is not None:
+            self._pending.append(sentence)
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        task = asyncio.create_task(self._get_embeddings(self._pending))
+        task.add_done_callback(self._log_failure)
+        self._tasks.append(task)
+        self._pending = []
+
+    def _log_failure(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            # 실패해도 _retrieve_matches에서 다시 요청하므로 기록만 함
+            self.logger.warning(
+                "summary_embedding_prefetch_failed", error=str(task.exception())
+            )
+
+
+class RetrievedJob(TypedDict):
+    id: str
+    cosine_similarity: float
+    maxsim_score: Optional[float]
+
+
+class RerankedJobRef(TypedDict):
+    id: str
+    reason: str
+    rank_title: str
 
 
 class RerankedJob(BaseModel):
@@ -30,19 +134,15 @@ class RerankedJob(BaseModel):
     reason: str
 
 
-class RerankedJobList(BaseModel):
-    results: List[RerankedJob]
-
-
 class MatchJobState(TypedDict):
     messages: Annotated[list, add_messages]
     resume_text: str
     named_company_experiences: list[int]
     summary_sentences: list[str]
-    sentence_embeddings: list[list[float]]
-    avg_embedding: list[float]
-    retrieved_jobs: list[dict]
-    reranked_results: list[dict]
+    # 체크포인트를 작게 유지하기 위해 임베딩은 저장하지 않고 임베딩 캐시에서 다시 읽으며,
+    # 공고는 id와 점수만 저장하고 읽을 때 job_read_model에서 채움
+    retrieved_jobs: list[RetrievedJob]
+    reranked_results: list[RerankedJobRef]
     is_valid_resume: bool
 
 
@@ -62,7 +162,20 @@ class LangGraphAgent:
         )
         self.graph: Optional[CompiledStateGraph] = None
         self._db_pool: Optional[AsyncConnectionPool] = None
+        self._embedding_cache: Optional[EmbeddingCache] = None
+        self._vector_index: Optional[JobVectorIndex] = None
+        self._checkpointer: Optional[BaseCheckpointSaver] = None
+        self._retention: Optional[CheckpointRetention] = None
         self._openai_client = AsyncOpenAI()
+        self._summary_cache: TTLCache[str, str] = TTLCache(
+            max_size=settings.SUMMARY_CACHE_SIZE, ttl=settings.SUMMARY_CACHE_TTL
+        )
+        # 캐시에서 밀려난 실행은 더 이상 이어받을 수 없으므로 중단
+        self._match_runs: TTLCache[str, MatchRun] = TTLCache(
+            max_size=settings.MATCH_RUN_CACHE_SIZE,
+            ttl=settings.MATCH_RUN_TTL,
+            on_evict=lambda _, run: run.cancel(),
+        )
         self.logger.info(
             "llm_initialized",
             model=settings.LLM_MODEL,
@@ -71,8 +184,12 @@ class LangGraphAgent:
 
     # summary
     async def _resume_summary(self, state: MatchJobState) -> dict:
+        # 이력서 원문은 resume_text에만 저장하고 프롬프트는 호출할 때 구성
+        messages = self.resume_summary_messages(state["resume_text"])
         return {
-            "messages": [await self.model.ainvoke(state["messages"])],
+            "messages": [
+                await self.model.ainvoke([message.model_dump() for message in messages])
+            ],
         }
 
     def resume_summary_messages(self, resume_text):
@@ -88,16 +205,27 @@ class LangGraphAgent:
 
     async def stream_resume_summary(
         self,
-        messages: List[Message],
         resume_text: str,
         named_company_experiences: list[int],
         session_id: str,
     ) -> AsyncGenerator[str, None]:
+        cache_key = summary_cache_key(resume_text)
+        cached_summary = self._summary_cache.get(cache_key)
+        if cached_summary is not None:
+            self.logger.info("resume_summary_cache_hit", session_id=session_id)
+            async for chunk in self._replay_resume_summary(
+                cached_summary,
+                resume_text,
+                named_company_experiences,
+                session_id,
+            ):
+                yield chunk
+            return
 
         try:
+            tokens = []
             async for token, _ in self.graph.astream(
                 {
-                    "messages": [message.model_dump() for message in messages],
                     "resume_text": resume_text,
                     "named_company_experiences": named_company_experiences,
                 },
@@ -105,24 +233,53 @@ class LangGraphAgent:
                 stream_mode="messages",
             ):
                 try:
+                    tokens.append(token.content)
                     yield token.content
                 except Exception as e:
                     self.logger.error(
                         "error_processing_token", error=str(e), session_id=session_id
                     )
                     raise e
+            self._summary_cache.set(cache_key, "".join(tokens))
             yield settings.DONE_TOKEN
         except Exception as e:
             self.logger.error("error_stream", error=str(e), session_id=session_id)
             raise e
 
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def _replay_resume_summary(
+        self,
+        summary: str,
+        resume_text: str,
+        named_company_experiences: list[int],
+        session_id: str,
+    ) -> AsyncGenerator[str, None]:
+        # resume_summary 노드가 실행된 것처럼 상태를 기록해 LLM 호출 없이 다음 단계로 진행
+        await self.graph.aupdate_state(
+            {"configurable": {"thread_id": session_id}},
+            {
+                "messages": [AIMessage(content=summary)],
+                "resume_text": resume_text,
+                "named_company_experiences": named_company_experiences,
+                "summary_sentences": parse_summary_sentences(summary),
+            },
+            as_node="resume_summary",
+        )
+        for line in summary.splitlines(keepends=True):
+            yield line
+        yield settings.DONE_TOKEN
+
+    async def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
         self.logger.info(f"임베딩 요청 ({len(texts)} 문장)")
         response = await self._openai_client.embeddings.create(
             input=texts, model=settings.OPENAI_EMBEDDING_MODEL
         )
         return [item.embedding for item in response.data]
 
+    def summary_embedding_prefetcher(self) -> SummaryEmbeddingPrefetcher:
+        return SummaryEmbeddingPrefetcher(
+            self._embedding_cache.get_embeddings, settings.SUMMARY_EMBED_BATCH_SIZE
+        )
+
     # match
     async def _validate_resume(self, state: MatchJobState) -> dict:
         summary_sentences = state["summary_sentences"]
@@ -135,105 +292,327 @@ class LangGraphAgent:
 
     async def _route_by_resume_validity(self, state: MatchJobState) -> dict:
         if state["is_valid_resume"]:
-            return "embed_resume"
+            return "retrieve_matches"
         return "end"
 
-    async def _embed_resume(self, state: MatchJobState) -> dict:
-        embeddings = await self.get_embeddings(state["summary_sentences"])
-        avg_embedding = np.mean(embeddings, axis=0).tolist()
-        return {
-            "sentence_embeddings": embeddings,
-            "avg_embedding": avg_embedding,
-        }
+    async def _sentence_embeddings(self, state: MatchJobState) -> np.ndarray:
+        embeddings = await self._embedding_cache.get_embeddings(
+            state["summary_sentences"]
+        )
+        return np.vstack(embeddings)
 
     async def _retrieve_matches(self, state: MatchJobState) -> dict:
-        avg_embedding = state["avg_embedding"]
+        sentence_embeddings = await self._sentence_embeddings(state)
+        avg_embedding = sentence_embeddings.mean(axis=0).tolist()
+        # named_company_experiences는 회사 id 목록이므로 공고의 company_id로 제외
+        exclude_company_ids = state["named_company_experiences"]
+        if self._vector_index is not None and self._vector_index.ready:
+            job_rows = await self._retrieve_from_vector_index(
+                avg_embedding, exclude_company_ids, sentence_embeddings
+            )
+        else:
+            job_rows = await self._retrieve_from_pgvector(
+                avg_embedding, exclude_company_ids
+            )
+
+        retrieved_jobs = [
+            {
+                "id": str(job["id"]),
+                "cosine_similarity": job["cosine_similarity"],
+                "maxsim_score": job.get("maxsim_score"),
+            }
+            for job in job_rows
+        ]
+        get_stream_writer()({"candidates": retrieved_jobs})
+        return {"retrieved_jobs": retrieved_jobs}
+
+    async def _hydrate_jobs(self, refs: list[dict]) -> list[dict]:
+        """Load job_read_model rows for job refs, keeping order and ref fields."""
+        if not refs:
+            return []
         async with self._db_pool.connection() as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute(
                     """
-                        SELECT
-                            job_id, embedding <=> %s::vector AS distance
-                        FROM chapchap.job_embeddings
-                        ORDER BY distance
-                        LIMIT %s
+                        SELECT *
+                        FROM chapchap.job_read_model
+                        WHERE id = ANY(%s::uuid[])
                     """,
-                    (avg_embedding, settings.RETRIEVAL_COUNT),
+                    ([ref["id"] for ref in refs],),
                 )
-                rows = await cur.fetchall()
+                rows = {str(row["id"]): row for row in await cur.fetchall()}
 
-            job_id_distance_map = {}
-            for match in rows:
-                job_id_distance_map[match["job_id"]] = match["distance"]
+        jobs = []
+        for ref in refs:
+            row = rows.get(ref["id"])
+            # 체크포인트 이후 삭제된 공고는 제외
+            if row is None:
+                continue
+            jobs.append(self._merge_ref(row, ref))
+        return jobs
+
+    @staticmethod
+    def _merge_ref(row: dict, ref: dict) -> dict:
+        job = dict(row)
+        job.update(
+            (key, value)
+            for key, value in ref.items()
+            if key != "id" and value is not None
+        )
+        return job
 
+    async def _retrieve_from_vector_index(
+        self,
+        avg_embedding: list[float],
+        exclude_company_ids: list[int],
+        sentence_embeddings: np.ndarray,
+    ) -> list:
+        if settings.MAXSIM_ENABLED and self._vector_index.has_sentences:
+            matches = self._vector_index.late_interaction_search(
+                avg_embedding,
+                sentence_embeddings,
+                settings.RETRIEVAL_COUNT,
+                settings.MAXSIM_CANDIDATE_COUNT,
+                exclude_company_ids,
+            )
+        else:
+            matches = [
+                (job_id, distance, None)
+                for job_id, distance in self._vector_index.search(
+                    avg_embedding, settings.RETRIEVAL_COUNT, exclude_company_ids
+                )
+            ]
+        rank_map = {job_id: rank for rank, (job_id, _, _) in enumerate(matches)}
+        score_map = {
+            job_id: (distance, maxsim_score)
+            for job_id, distance, maxsim_score in matches
+        }
+        async with self._db_pool.connection() as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
-                job_ids = list(job_id_distance_map.keys())
                 await cur.execute(
                     """
-                    SELECT
-                        j.*,
-                        c.name AS company_name,
-                        ac.name AS affiliate_company_name,
-                        ARRAY_REMOVE(ARRAY_AGG(t.name), NULL) AS tags
-                    FROM chapchap.job_info j
-                    JOIN chapchap.companies c ON j.company_id = c.id 
-                    JOIN chapchap.affiliate_companies ac ON j.affiliate_company_id = ac.id
-                    LEFT JOIN chapchap.job_tags jt ON j.id = jt.job_id
-                    LEFT JOIN chapchap.tags t ON jt.tag_id = t.id
-                    WHERE j.id = ANY(%s)
-                    GROUP BY j.id, c.name, ac.name
+                        SELECT *
+                        FROM chapchap.job_read_model
+                        WHERE id = ANY(%s)
                     """,
-                    (job_ids,),
+                    (list(score_map.keys()),),
                 )
                 job_rows = await cur.fetchall()
 
-                await cur.execute(
-                    """
-                        SELECT job_id, type, sentence_index, sentence
-                        FROM chapchap.job_qualification_sentences
-                        WHERE type != 'title'
-                        ORDER BY job_id, type, sentence_index
-                    """
-                )
-                sentence_rows = await cur.fetchall()
-
-        qualifications_map = defaultdict(lambda: {"required": [], "preferred": []})
-        for row in sentence_rows:
-            qualifications_map[row["job_id"]][row["type"]].append(row["sentence"])
-
-        named_company_experiences = state["named_company_experiences"]
-        results = []
         for job in job_rows:
-            job_dict = dict(job)
-            job_id = job_dict["id"]
-            if job_id in named_company_experiences:
-                continue
-            job_dict["qualifications"] = qualifications_map[job_id]["required"]
-            job_dict["preferred_qualifications"] = qualifications_map[job_id][
-                "preferred"
-            ]
-            job_dict["cosine_similarity"] = 1 - job_id_distance_map[job_id]
-            results.append(job_dict)
-
-        results.sort(key=lambda x: x["cosine_similarity"], reverse=True)
-
-        return {"retrieved_jobs": results}
+            distance, maxsim_score = score_map[job["id"]]
+            job["cosine_similarity"] = 1 - distance
+            if maxsim_score is not None:
+                job["maxsim_score"] = maxsim_score
+        job_rows.sort(key=lambda x: rank_map[x["id"]])
+        return job_rows
+
+    async def _retrieve_from_pgvector(
+        self, avg_embedding: list[float], exclude_company_ids: list[int]
+    ) -> list:
+        # 비활성 공고와 지원자 경력 회사는 HNSW 검색 안에서 제외하고,
+        # 필터로 후보가 부족하면 ef_search를 늘려 k개가 찰 때까지 다시 검색
+        ef_search = max(settings.HNSW_EF_SEARCH, settings.RETRIEVAL_COUNT * 4)
+        async with self._db_pool.connection() as conn:
+            async with conn.transaction():
+                async with conn.cursor(row_factory=dict_row) as cur:
+                    while True:
+                        await cur.execute(
+                            "SELECT set_config('hnsw.ef_search', %s, true)",
+                            (str(ef_search),),
+                        )
+                        await cur.execute(
+                            """
+                                WITH candidates AS (
+                                    SELECT
+                                        e.job_id,
+                                        e.embedding <=> %s::vector AS distance
+                                    FROM chapchap.job_embeddings e
+                                    JOIN chapchap.job_info j ON j.id = e.job_id
+                                    WHERE
+                                        j.is_active = true
+                                        AND j.company_id <> ALL(%s::int[])
+                                    ORDER BY distance
+                                    LIMIT %s
+                                )
+                                SELECT
+                                    r.*,
+                                    1 - c.distance AS cosine_similarity
+                                FROM candidates c
+                                JOIN chapchap.job_read_model r ON r.id = c.job_id
+                                ORDER BY c.distance
+                            """,
+                            (
+                                avg_embedding,
+                                exclude_company_ids,
+                                settings.RETRIEVAL_COUNT,
+                            ),
+                        )
+                        job_rows = await cur.fetchall()
+                        if (
+                            len(job_rows) >= settings.RETRIEVAL_COUNT
+                            or ef_search >= settings.HNSW_MAX_EF_SEARCH
+                        ):
+                            return job_rows
+                        ef_search = min(ef_search * 2, settings.HNSW_MAX_EF_SEARCH)
 
     async def _rerank_matches(self, state: MatchJobState) -> dict:
-        prompt = rerank_job_prompt(state["resume_text"], state["retrieved_jobs"])
+        retrieved_jobs = await self._hydrate_jobs(state["retrieved_jobs"])
+        relevance = None
+        if self._vector_index is not None and self._vector_index.has_sentences:
+            sentence_embeddings = await self._sentence_embeddings(state)
+
+            def relevance(job: dict) -> dict:
+                return self._vector_index.sentence_relevance(
+                    job["id"], sentence_embeddings
+                )
+
+        jobs = build_rerank_context(
+            state["summary_sentences"], retrieved_jobs, relevance
+        )
+        prompt = rerank_job_prompt(state["summary_sentences"], jobs)
+        self.logger.info(
+            "rerank_context_built",
+            job_count=len(jobs),
+            retrieved_count=len(retrieved_jobs),
+            estimated_tokens=estimate_tokens(prompt),
+        )
         messages = [HumanMessage(content=prompt)]
-        structured_llm = self.model.with_structured_output(RerankedJobList)
-        rerank_output = await structured_llm.ainvoke(messages)
+        # 도구 호출 방식의 structured output은 결과가 한 번에 도착하므로
+        # JSON 텍스트를 스트리밍하며 부분 파싱해 완성된 항목부터 내보냄
+        json_llm = self._json_model() | JsonOutputParser()
+        writer = get_stream_writer()
 
         result = []
-        for job in rerank_output.results:
-            job_info = state["retrieved_jobs"][job.job_idx]
-            job_info["reason"] = job.reason
-            job_info["rank_title"] = job.job_title
-            result.append(job_info)
+        emitted = 0
+
+        def emit(entry: dict) -> None:
+            try:
+                job = RerankedJob.model_validate(entry)
+            except ValidationError as e:
+                self.logger.warning("rerank_entry_invalid", entry=entry, error=str(e))
+                return
+            # 프롬프트에 포함된 공고만 선택할 수 있음
+            if not 0 <= job.job_idx < len(jobs):
+                return
+            job_info = retrieved_jobs[job.job_idx]
+            ref = {
+                "id": str(job_info["id"]),
+                "reason": job.reason,
+                "rank_title": job.job_title,
+            }
+            result.append(ref)
+            writer(
+                {
+                    "reranked_job": {
+                        **ref,
+                        "cosine_similarity": job_info.get("cosine_similarity"),
+                        "maxsim_score": job_info.get("maxsim_score"),
+                    }
+                }
+            )
+
+        entries = []
+        async for partial in json_llm.astream(messages):
+            if not isinstance(partial, dict) or not isinstance(
+                partial.get("results"), list
+            ):
+                continue
+            entries = partial["results"]
+            # 마지막 항목은 아직 생성 중일 수 있으므로 다음 항목이 시작된 항목만 내보냄
+            while emitted < len(entries) - 1:
+                emit(entries[emitted])
+                emitted += 1
+
+        for entry in entries[emitted:]:
+            emit(entry)
 
         return {"reranked_results": result}
 
+    def _json_model(self):
+        # Gemini는 응답 MIME 타입을 지정하면 코드 블록 없이 JSON만 출력
+        if isinstance(self.model, ChatGoogleGenerativeAI):
+            return self.model.bind(
+                generation_config={"response_mime_type": "application/json"}
+            )
+        return self.model
+
+    async def _match_events(self, session_id: str) -> AsyncGenerator[dict, None]:
+        """Resume the match path and yield events as soon as they are available.
+
+        The vector-ranked candidates are yielded right after retrieval, then
+        every reranked job as soon as the LLM has finished writing it. Jobs
+        are yielded as refs (id, scores and rerank fields) so a buffered
+        MatchRun stays small; `stream_match_jobs` hydrates them.
+        """
+        config = {"configurable": {"thread_id": session_id}}
+        snapshot = await self.graph.aget_state(config)
+        if not snapshot.next:
+            # 이미 끝난 세션은 저장된 결과를 그대로 재생
+            values = snapshot.values
+            if values.get("is_valid_resume") is False:
+                yield {"type": "invalid_resume"}
+            retrieved_jobs = values.get("retrieved_jobs", [])
+            if retrieved_jobs:
+                yield {"type": "candidates", "jobs": retrieved_jobs}
+            scores = {ref["id"]: ref for ref in retrieved_jobs}
+            for ref in values.get("reranked_results", []):
+                yield {"type": "reranked", "job": {**scores.get(ref["id"], {}), **ref}}
+            yield {"type": "done"}
+            return
+
+        async for mode, chunk in self.graph.astream(
+            None, config, stream_mode=["updates", "custom"]
+        ):
+            if mode == "custom":
+                if "candidates" in chunk:
+                    yield {"type": "candidates", "jobs": chunk["candidates"]}
+                else:
+                    yield {"type": "reranked", "job": chunk["reranked_job"]}
+            elif "validate_resume" in chunk:
+                if chunk["validate_resume"]["is_valid_resume"] is False:
+                    yield {"type": "invalid_resume"}
+        yield {"type": "done"}
+
+    def start_match(self, session_id: str) -> MatchRun:
+        run = MatchRun(session_id, self._match_events(session_id))
+        self._match_runs.set(session_id, run)
+        return run
+
+    async def stream_match_jobs(self, session_id: str) -> AsyncGenerator[dict, None]:
+        # 요약이 끝났을 때 미리 시작된 실행이 있으면 그 결과를 이어받음
+        run = self._match_runs.get(session_id)
+        if run is None or run.failed:
+            run = self.start_match(session_id)
+        else:
+            self.logger.info("match_run_reused", session_id=session_id)
+        # 후보로 읽은 공고는 rerank 결과를 채울 때 다시 조회하지 않음
+        hydrated: dict[str, dict] = {}
+        async for event in run.subscribe():
+            if event["type"] == "candidates":
+                jobs = await self._hydrate_jobs(event["jobs"])
+                hydrated.update((str(job["id"]), job) for job in jobs)
+                yield {"type": "candidates", "jobs": jobs}
+            elif event["type"] == "reranked":
+                ref = event["job"]
+                if ref["id"] in hydrated:
+                    jobs = [self._merge_ref(hydrated[ref["id"]], ref)]
+                else:
+                    jobs = await self._hydrate_jobs([ref])
+                for job in jobs:
+                    yield {"type": "reranked", "job": job}
+            else:
+                yield event
+
+    async def match_jobs(self, session_id: str) -> list[dict]:
+        result = []
+        async for event in self.stream_match_jobs(session_id):
+            if event["type"] == "reranked":
+                result.append(event["job"])
+            elif event["type"] == "error":
+                raise RuntimeError(event["error"])
+        return result
+
     # coverletter
 
     async def get_cover_letter_prompt(self, resume_text: str, job_id: str) -> str:
@@ -241,39 +620,15 @@ class LangGraphAgent:
             async with conn.cursor(row_factory=dict_row) as cur:
                 await cur.execute(
                     """
-                        SELECT
-                            j.*,
-                            c.name AS company_name,
-                            ac.name AS affiliate_company_name
-                        FROM chapchap.job_info j
-                        JOIN chapchap.companies c ON j.company_id = c.id 
-                        JOIN chapchap.affiliate_companies ac ON j.affiliate_company_id = ac.id
-                        WHERE j.id = %s
+                        SELECT *
+                        FROM chapchap.job_read_model
+                        WHERE id = %s
                     """,
                     (job_id,),
                 )
                 job_row = await cur.fetchone()
 
-                await cur.execute(
-                    """
-                        SELECT job_id, type, sentence_index, sentence
-                        FROM chapchap.job_qualification_sentences
-                        WHERE type != 'title' AND job_id = %s
-                        ORDER BY job_id, type, sentence_index
-                    """,
-                    (job_id,),
-                )
-                sentence_rows = await cur.fetchall()
-
-        qualifications_map = defaultdict(lambda: {"required": [], "preferred": []})
-        for row in sentence_rows:
-            qualifications_map[row["job_id"]][row["type"]].append(row["sentence"])
-
-        job_dict = dict(job_row)
-        job_dict["qualifications"] = qualifications_map[job_id]["required"]
-        job_dict["preferred_qualifications"] = qualifications_map[job_id]["preferred"]
-
-        return cover_letter_prompt(resume_text, job_dict)
+        return cover_letter_prompt(resume_text, dict(job_row))
 
     async def stream_cover_letter(self, prompt: str) -> AsyncGenerator[str, None]:
         try:
@@ -292,7 +647,25 @@ class LangGraphAgent:
     async def create(cls) -> "LangGraphAgent":
         agent = cls()
         await agent._get_connection_pool()
+        agent._embedding_cache = EmbeddingCache(
+            agent._db_pool,
+            agent._request_embeddings,
+            settings.OPENAI_EMBEDDING_MODEL,
+            settings.EMBEDDING_CACHE_SIZE,
+        )
+        if settings.VECTOR_INDEX_ENABLED:
+            agent._vector_index = await JobVectorIndex.create(
+                agent._db_pool, load_sentences=settings.MAXSIM_ENABLED
+            )
         await agent._create_graph()
+        # 체크포인트가 Postgres에 쌓이는 경우에만 보존 기간 관리가 필요
+        if settings.CHECKPOINTER != "memory" or settings.CHECKPOINT_WRITE_THROUGH:
+            agent._retention = CheckpointRetention.create(
+                agent._db_pool,
+                ttl=settings.CHECKPOINT_RETENTION_TTL,
+                batch_size=settings.CHECKPOINT_SWEEP_BATCH_SIZE,
+                sweep_interval=settings.CHECKPOINT_SWEEP_INTERVAL,
+            )
         return agent
 
     async def _get_connection_pool(self) -> AsyncConnectionPool:
@@ -317,23 +690,42 @@ class LangGraphAgent:
         )
         return self._db_pool
 
+    async def _create_checkpointer(self) -> BaseCheckpointSaver:
+        if settings.CHECKPOINTER == "memory":
+            durable = None
+            if settings.CHECKPOINT_WRITE_THROUGH:
+                durable = AsyncPostgresSaver(self._db_pool)
+                await durable.setup()
+            self._checkpointer = TTLMemorySaver(
+                ttl=settings.CHECKPOINT_TTL,
+                max_threads=settings.CHECKPOINT_MAX_THREADS,
+                durable=durable,
+                flush_interval=settings.CHECKPOINT_FLUSH_INTERVAL,
+            )
+        else:
+            self._checkpointer = AsyncPostgresSaver(self._db_pool)
+            await self._checkpointer.setup()
+        self.logger.info(
+            "checkpointer_created",
+            checkpointer=type(self._checkpointer).__name__,
+            write_through=settings.CHECKPOINT_WRITE_THROUGH,
+        )
+        return self._checkpointer
+
     async def _create_graph(self):
-        checkpointer = AsyncPostgresSaver(self._db_pool)
-        await checkpointer.setup()
+        checkpointer = await self._create_checkpointer()
 
         graph_builder = StateGraph(MatchJobState)
         graph_builder.add_node("resume_summary", self._resume_summary)
         graph_builder.add_node("validate_resume", self._validate_resume)
-        graph_builder.add_node("embed_resume", self._embed_resume)
         graph_builder.add_node("retrieve_matches", self._retrieve_matches)
         graph_builder.add_node("rerank_matches", self._rerank_matches)
         graph_builder.add_edge("resume_summary", "validate_resume")
         graph_builder.add_conditional_edges(
             "validate_resume",
             self._route_by_resume_validity,
-            {"embed_resume": "embed_resume", "end": END},
+            {"retrieve_matches": "retrieve_matches", "end": END},
         )
-        graph_builder.add_edge("embed_resume", "retrieve_matches")
         graph_builder.add_edge("retrieve_matches", "rerank_matches")
         graph_builder.add_edge("rerank_matches", END)
         graph_builder.set_entry_point("resume_summary")
@@ -345,19 +737,29 @@ class LangGraphAgent:
         )
 
     async def clear_chat_history(self, session_id: str) -> None:
-        async with self._db_pool.connection() as conn:
-            async with conn.cursor() as cur:
-                for table in settings.CHECKPOINT_TABLES:
-                    await cur.execute(
-                        f"""
-                        DELETE FROM chapchap.{table}
-                        WHERE thread_id = %s
-                        """,
-                        (session_id,),
-                    )
-                    self.logger.info(
-                        f"Cleared chapchap.{table} for session {session_id}"
-                    )
+        run = self._match_runs.pop(session_id)
+        if run is not None:
+            run.cancel()
+        if isinstance(self._checkpointer, TTLMemorySaver):
+            await self._checkpointer.forget(session_id)
+        if self._retention is not None:
+            await self._retention.reset_thread(session_id)
+            self.logger.info("chat_history_cleared", session_id=session_id)
+
+    def checkpoint_retention_metrics(self) -> Optional[dict]:
+        if self._retention is None:
+            return None
+        return self._retention.metrics()
 
     async def close(self):
+        if self._retention is not None:
+            await self._retention.close()
+        for session_id in list(self._match_runs.keys()):
+            run = self._match_runs.pop(session_id)
+            if run is not None:
+                run.cancel()
+        if isinstance(self._checkpointer, TTLMemorySaver):
+            await self._checkpointer.close()
+        if self._vector_index is not None:
+            await self._vector_index.close()
         await self._db_pool.close()
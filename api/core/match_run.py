@@ -0,0 +1,71 @@
+import asyncio
+from typing import AsyncGenerator, AsyncIterator
+
+import structlog
+
+
+class MatchRun:
+    """Background continuation of the match path for one session.
+
+    Events from the source stream are buffered, so a request that arrives
+    later replays what has already been produced and then follows the live
+    stream. Any number of subscribers may read the same run.
+    """
+
+    def __init__(self, session_id: str, source: AsyncIterator[dict]):
+        self.logger = structlog.stdlib.get_logger("match_run")
+        self.session_id = session_id
+        self.events: list[dict] = []
+        self.finished = False
+        self.failed = False
+        self._changed = asyncio.Condition()
+        self._task = asyncio.create_task(self._run(source))
+        self._task.add_done_callback(self._on_done)
+
+    async def _append(self, event: dict) -> None:
+        async with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def _run(self, source: AsyncIterator[dict]) -> None:
+        try:
+            async for event in source:
+                await self._append(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(
+                "match_run_failed", error=str(e), session_id=self.session_id
+            )
+            self.failed = True
+            await self._append({"type": "error", "error": str(e)})
+        finally:
+            await self._finish()
+
+    async def _finish(self) -> None:
+        async with self._changed:
+            self.finished = True
+            self._changed.notify_all()
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        # 시작 전에 취소된 작업은 _run의 finally가 실행되지 않으므로 여기서 종료를 알림
+        if not self.finished:
+            asyncio.get_running_loop().create_task(self._finish())
+
+    async def subscribe(self) -> AsyncGenerator[dict, None]:
+        position = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(
+                    lambda: position < len(self.events) or self.finished
+                )
+                pending = self.events[position:]
+                finished = self.finished
+            for event in pending:
+                yield event
+            position += len(pending)
+            if finished and position == len(self.events):
+                return
+
+    def cancel(self) -> None:
+        self._task.cancel()
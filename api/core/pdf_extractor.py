@@ -0,0 +1,116 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pymupdf
+import structlog
+
+
+class ResumeExtractionError(ValueError):
+    """Raised when an uploaded resume cannot or may not be parsed."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _extract_pages(data: bytes, start: int, stop: int) -> tuple[int, list[str]]:
+    # 워커 프로세스에서 실행되므로 모듈 최상위 함수여야 함
+    with pymupdf.open(stream=data, filetype="pdf") as document:
+        page_count = document.page_count
+        texts = [
+            document[page_index].get_text()
+            for page_index in range(start, min(stop, page_count))
+        ]
+    return page_count, texts
+
+
+class ResumeExtractor:
+    """Parses PDF resumes from in-memory bytes in a bounded process pool.
+
+    Parsing never runs on the event loop. The first chunk of pages also
+    reports the page count; the remaining chunks of a long PDF are extracted
+    in parallel. Workers are spawned rather than forked from the threaded
+    server, and a pool broken by a crashing worker is replaced so one
+    malformed PDF cannot fail every later upload.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_bytes: int,
+        max_pages: int,
+        pages_per_task: int,
+    ):
+        self.logger = structlog.stdlib.get_logger("pdf_extractor")
+        self._max_workers = max_workers
+        self._executor = self._create_executor()
+        self._max_bytes = max_bytes
+        self._max_pages = max_pages
+        self._pages_per_task = pages_per_task
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> None:
+        # 동시에 실패한 요청들이 풀을 여러 번 교체하지 않도록 현재 풀일 때만 교체
+        if self._executor is broken:
+            self.logger.warning("pdf_worker_pool_replaced")
+            self._executor = self._create_executor()
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_pages(
+        self, data: bytes, start: int, stop: int
+    ) -> tuple[int, list[str]]:
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self._executor
+            try:
+                return await loop.run_in_executor(
+                    executor, _extract_pages, data, start, stop
+                )
+            except BrokenProcessPool:
+                self._replace_executor(executor)
+                if attempt == 1:
+                    raise
+
+    async def extract_text(self, data: bytes) -> str:
+        if len(data) > self._max_bytes:
+            raise ResumeExtractionError(
+                f"PDF 파일은 {self._max_bytes // (1024 * 1024)}MB 이하만 가능합니다.",
+                status_code=413,
+            )
+
+        try:
+            page_count, texts = await self._run_pages(data, 0, self._pages_per_task)
+            if page_count > self._max_pages:
+                raise ResumeExtractionError(
+                    f"PDF 파일은 {self._max_pages}페이지 이하만 가능합니다.",
+                    status_code=413,
+                )
+            chunks = await asyncio.gather(
+                *[
+                    self._run_pages(data, start, start + self._pages_per_task)
+                    for start in range(
+                        self._pages_per_task, page_count, self._pages_per_task
+                    )
+                ]
+            )
+        except ResumeExtractionError:
+            raise
+        except Exception as e:
+            self.logger.error("pdf_extraction_failed", error=str(e))
+            raise ResumeExtractionError("PDF 파일을 읽을 수 없습니다.") from e
+
+        for _, chunk_texts in chunks:
+            texts.extend(chunk_texts)
+
+        self.logger.info("pdf_extracted", page_count=page_count, size=len(data))
+        return "\n".join(texts)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -24,26 +24,28 @@ def resume_summary_prompt() -> str:
 """
 
 
-def rerank_job_prompt(resume_text: str, jobs: list[dict]) -> str:
-    job_list = "\n\n".join(
-        [
-            f"공고번호 {i}. {job['job_title']} ({job['company_name']})\n"
-            f"  - 팀 소개: {job['team_info']}\n"
-            f"  - 담당업무:\n    " + "\n    ".join(job["responsibilities"]) + "\n"
-            f"  - 지원자격:\n    " + "\n    ".join(job["qualifications"]) + "\n"
-            f"  - 우대사항:\n    " + "\n    ".join(job["preferred_qualifications"])
-            for i, job in enumerate(jobs)
-        ]
+def rerank_job_entry(i: int, job: dict) -> str:
+    return (
+        f"공고번호 {i}. {job['job_title']} ({job['company_name']})\n"
+        f"  - 팀 소개: {job['team_info']}\n"
+        f"  - 담당업무:\n    " + "\n    ".join(job["responsibilities"]) + "\n"
+        f"  - 지원자격:\n    " + "\n    ".join(job["qualifications"]) + "\n"
+        f"  - 우대사항:\n    " + "\n    ".join(job["preferred_qualifications"])
     )
+
+
+def rerank_job_prompt(summary_sentences: list[str], jobs: list[dict]) -> str:
+    job_list = "\n\n".join([rerank_job_entry(i, job) for i, job in enumerate(jobs)])
+    resume_summary = "\n".join(f"- {sentence}" for sentence in summary_sentences)
     return f"""
 다음은 당신이 가진 채용공고의 리스트입니다.
-당신은 이 채용공고 중 지원자가 적합한 {settings.RERANK_COUNT}개의 공고를 선별하고 적합한 순으로 정렬하고 설명을 첨부해야 합니다.
+당신은 이 채용공고 중 지원자가 적합한 {min(settings.RERANK_COUNT, len(jobs))}개의 공고를 선별하고 적합한 순으로 정렬하고 설명을 첨부해야 합니다.
 적합한 이유는 100자 이내로 명시해야 합니다.
 지원자의 이름은 언급하지 않고 지원자라고 표현해야 합니다.
 
-이력서는 다음과 같습니다.
-===이력서 (정제되지 않은 텍스트)
-{resume_text}
+지원자의 이력서 요약은 다음과 같습니다.
+===이력서 요약 (경력 순서와 능력)
+{resume_summary}
 
 
 ===채용공고 리스트
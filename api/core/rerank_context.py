@@ -0,0 +1,80 @@
+import math
+from typing import Callable, Optional
+
+from core.config import settings
+from core.prompts import rerank_job_entry, rerank_job_prompt
+
+
+def estimate_tokens(text: str) -> int:
+    # 한국어는 대략 2자당 1토큰이므로 보수적으로 계산
+    return math.ceil(len(text) / 2)
+
+
+def _select_sentences(
+    sentences: list[str],
+    sentence_type: str,
+    relevance: dict[tuple[str, int], float],
+    limit: int,
+) -> list[str]:
+    if len(sentences) <= limit:
+        return sentences
+    if not relevance:
+        return sentences[:limit]
+    selected = sorted(
+        range(len(sentences)),
+        key=lambda i: relevance.get((sentence_type, i), float("-inf")),
+        reverse=True,
+    )[:limit]
+    # 공고 원문의 순서는 유지
+    return [sentences[i] for i in sorted(selected)]
+
+
+def compact_job(job: dict, relevance: dict[tuple[str, int], float]) -> dict:
+    team_info = job["team_info"] or ""
+    if len(team_info) > settings.RERANK_TEAM_INFO_CHARS:
+        team_info = team_info[: settings.RERANK_TEAM_INFO_CHARS] + "…"
+    return {
+        "job_title": job["job_title"],
+        "company_name": job["company_name"],
+        "team_info": team_info,
+        "responsibilities": (job["responsibilities"] or [])[
+            : settings.RERANK_MAX_RESPONSIBILITIES
+        ],
+        "qualifications": _select_sentences(
+            job["qualifications"] or [],
+            "required",
+            relevance,
+            settings.RERANK_MAX_QUALIFICATIONS,
+        ),
+        "preferred_qualifications": _select_sentences(
+            job["preferred_qualifications"] or [],
+            "preferred",
+            relevance,
+            settings.RERANK_MAX_QUALIFICATIONS,
+        ),
+    }
+
+
+def build_rerank_context(
+    summary_sentences: list[str],
+    jobs: list[dict],
+    relevance: Optional[Callable[[dict], dict[tuple[str, int], float]]] = None,
+    token_budget: Optional[int] = None,
+) -> list[dict]:
+    """Compact retrieved jobs for the rerank prompt within a token budget.
+
+    Jobs are packed in retrieval order and the result is always a prefix of
+    `jobs`, so `job_idx` in the LLM output still indexes the original list.
+    """
+    if token_budget is None:
+        token_budget = settings.RERANK_TOKEN_BUDGET
+    used = estimate_tokens(rerank_job_prompt(summary_sentences, []))
+    compacted = []
+    for i, job in enumerate(jobs):
+        compact = compact_job(job, relevance(job) if relevance else {})
+        tokens = estimate_tokens(rerank_job_entry(i, compact))
+        if compacted and used + tokens > token_budget:
+            break
+        used += tokens
+        compacted.append(compact)
+    return compacted
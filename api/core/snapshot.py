@@ -0,0 +1,206 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Awaitable, Callable, Optional
+
+import brotli
+import structlog
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from psycopg_pool import AsyncConnectionPool
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+@dataclass
+class Snapshot:
+    version: str
+    etag: str
+    data: Any
+    encoded: dict[str, bytes]
+    built_at: float = field(default_factory=time.time)
+
+
+def encode_payload(data: Any) -> dict[str, bytes]:
+    """Serialize data to UTF-8 JSON once and keep compressed variants."""
+    body = json.dumps(
+        jsonable_encoder(data), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    return {
+        "identity": body,
+        "gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+        "br": brotli.compress(body, quality=BROTLI_QUALITY),
+    }
+
+
+class SnapshotCache:
+    """Version-stamped in-process cache for read-mostly job_info responses.
+
+    The data only changes when the scraper runs, so every snapshot is keyed by
+    a cheap data version (latest job_read_model refresh, active row count and
+    the current date for the "uploaded in a day/week" flags). The version itself is
+    re-checked at most once per `check_interval` seconds, so repeated reads
+    are served without touching Postgres.
+    """
+
+    VERSION_QUERY = """
+        SELECT
+            MAX(refreshed_at) AS max_refreshed_at,
+            COUNT(*) FILTER (WHERE is_active = true) AS active_count
+        FROM chapchap.job_read_model
+    """
+
+    def __init__(self, db_pool: AsyncConnectionPool, check_interval: float):
+        self.logger = structlog.stdlib.get_logger("snapshot")
+        self._db_pool = db_pool
+        self._check_interval = check_interval
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._version_lock = asyncio.Lock()
+        self._snapshots: dict[str, Snapshot] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def current_version(self) -> str:
+        if (
+            self._version is not None
+            and time.monotonic() - self._version_checked_at < self._check_interval
+        ):
+            return self._version
+
+        async with self._version_lock:
+            # 다른 요청이 이미 갱신했으면 그대로 사용
+            if (
+                self._version is not None
+                and time.monotonic() - self._version_checked_at < self._check_interval
+            ):
+                return self._version
+
+            async with self._db_pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(self.VERSION_QUERY)
+                    max_refreshed_at, active_count = await cur.fetchone()
+
+            version = ":".join(
+                [
+                    max_refreshed_at.isoformat() if max_refreshed_at else "",
+                    str(active_count),
+                    date.today().isoformat(),
+                ]
+            )
+            if version != self._version:
+                self.logger.info("snapshot_version_changed", version=version)
+            self._version = version
+            self._version_checked_at = time.monotonic()
+            return version
+
+    async def get(self, key: str, builder: Callable[[], Awaitable[Any]]) -> Snapshot:
+        version = await self.current_version()
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # 동시에 들어온 요청은 한 번만 빌드하고 결과를 공유
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.version == version:
+                return snapshot
+
+            start_time = time.perf_counter()
+            data = await builder()
+            # 압축은 CPU 작업이므로 이벤트 루프 밖에서 수행
+            encoded = await asyncio.to_thread(encode_payload, data)
+            snapshot = Snapshot(
+                version=version,
+                etag='"'
+                + hashlib.sha1(f"{key}:{version}".encode()).hexdigest()[:16]
+                + '"',
+                data=data,
+                encoded=encoded,
+            )
+            self._snapshots[key] = snapshot
+            self.logger.info(
+                "snapshot_built",
+                key=key,
+                version=version,
+                size={name: len(body) for name, body in encoded.items()},
+                duration=time.perf_counter() - start_time,
+            )
+            return snapshot
+
+    def invalidate(self) -> None:
+        self._version = None
+        self._snapshots.clear()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def select_encoding(accept_encoding: Optional[str], available) -> str:
+    """Pick the best available content-coding allowed by Accept-Encoding."""
+    if not accept_encoding:
+        return "identity"
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            param = param.strip()
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        accepted[name.strip().lower()] = q
+    for encoding in ("br", "gzip"):
+        if encoding in available and accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+
+def variant_etag(etag: str, encoding: str) -> str:
+    if encoding == "identity":
+        return etag
+    return etag[:-1] + f"-{encoding}" + '"'
+
+
+def snapshot_response(request: Request, snapshot: Snapshot) -> Response:
+    """Serve pre-serialized snapshot bytes, honoring If-None-Match and Accept-Encoding."""
+    encoding = select_encoding(request.headers.get("accept-encoding"), snapshot.encoded)
+    etag = variant_etag(snapshot.etag, encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if any(
+        etag_matches(if_none_match, variant_etag(snapshot.etag, name))
+        for name in snapshot.encoded
+    ):
+        return Response(status_code=304, headers=headers)
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(
+        content=snapshot.encoded[encoding],
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,326 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+import numpy as np
+import structlog
+from psycopg_pool import AsyncConnectionPool
+
+from core.config import settings
+
+
+@dataclass(frozen=True)
+class _IndexData:
+    version: Optional[int]
+    job_ids: np.ndarray
+    company_ids: np.ndarray
+    matrix: np.ndarray
+    # 공고별 문장 임베딩을 한 배열에 이어 붙이고 [start, end) 구간으로 접근
+    sentence_matrix: Optional[np.ndarray] = None
+    sentence_starts: Optional[np.ndarray] = None
+    sentence_ends: Optional[np.ndarray] = None
+    # 각 문장의 (type, sentence_index)와 공고 id -> 행 번호
+    sentence_keys: Optional[list] = None
+    job_positions: Optional[dict] = None
+
+
+class JobVectorIndex:
+    """Exact in-memory kNN over the mean embeddings of active jobs.
+
+    Rows are L2-normalized float32 vectors in one contiguous matrix with a
+    parallel id array, so cosine top-k is a matrix-vector product plus
+    `argpartition`. The embedder bumps `index_versions.job_embeddings` when
+    it finishes; a background task reloads the matrix and swaps it in with a
+    single reference assignment. Until the first load succeeds `ready` is
+    False and callers fall back to pgvector.
+
+    Embeddings are read over a binary cursor, so each vector arrives as the
+    raw pgvector wire value and is decoded with numpy off the event loop.
+
+    With `load_sentences` the required and preferred qualification sentence
+    embeddings of every job are kept
+    too, packed as float16 in one array, for late-interaction (MaxSim)
+    re-scoring of the mean-vector candidates.
+    """
+
+    VERSION_QUERY = """
+        SELECT version
+        FROM chapchap.index_versions
+        WHERE name = 'job_embeddings'
+    """
+
+    LOAD_QUERY = """
+        SELECT e.job_id, j.company_id, e.embedding
+        FROM chapchap.job_embeddings e
+        JOIN chapchap.job_info j ON j.id = e.job_id
+        WHERE j.is_active = true AND e.embedding IS NOT NULL
+    """
+
+    # MaxSim과 rerank 문장 선택은 자격 요건 문장만 쓰므로 제목(title) 행은 읽지 않음
+    LOAD_SENTENCES_QUERY = """
+        SELECT s.job_id, s.type, s.sentence_index, s.embedding
+        FROM chapchap.job_qualification_sentences s
+        JOIN chapchap.job_info j ON j.id = s.job_id
+        WHERE j.is_active = true
+          AND s.embedding IS NOT NULL
+          AND s.type IN ('required', 'preferred')
+        ORDER BY s.job_id, s.type, s.sentence_index
+    """
+
+    def __init__(self, db_pool: AsyncConnectionPool, load_sentences: bool = False):
+        self.logger = structlog.stdlib.get_logger("vector_index")
+        self._db_pool = db_pool
+        self._load_sentences = load_sentences
+        self._data: Optional[_IndexData] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def create(
+        cls, db_pool: AsyncConnectionPool, load_sentences: bool = False
+    ) -> "JobVectorIndex":
+        index = cls(db_pool, load_sentences)
+        try:
+            await index.refresh()
+        except Exception as e:
+            index.logger.error("vector_index_load_failed", error=str(e))
+        index._refresh_task = asyncio.create_task(index._refresh_loop())
+        return index
+
+    @property
+    def ready(self) -> bool:
+        return self._data is not None and len(self._data.job_ids) > 0
+
+    async def refresh(self) -> None:
+        async with self._db_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self.VERSION_QUERY)
+                row = await cur.fetchone()
+                version = row[0] if row else None
+                if self._data is not None and version == self._data.version:
+                    return
+            # vector 타입은 등록된 로더가 없어 바이너리 결과가 bytes 그대로 반환됨
+            async with conn.cursor(binary=True) as cur:
+                await cur.execute(self.LOAD_QUERY)
+                rows = await cur.fetchall()
+                sentence_rows = []
+                if self._load_sentences:
+                    await cur.execute(self.LOAD_SENTENCES_QUERY)
+                    sentence_rows = await cur.fetchall()
+
+        data = await asyncio.to_thread(self._build, version, rows, sentence_rows)
+        self._data = data
+        self.logger.info(
+            "vector_index_loaded",
+            version=version,
+            job_count=len(data.job_ids),
+            sentence_count=len(sentence_rows),
+        )
+
+    @property
+    def has_sentences(self) -> bool:
+        return self._data is not None and self._data.sentence_matrix is not None
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    @staticmethod
+    def _decode_vectors(values: list) -> np.ndarray:
+        """Decode pgvector binary values into a float32 matrix.
+
+        Each value is an int16 dimension and an unused int16 followed by
+        big-endian float4 components, so the 4-byte header is one extra column.
+        """
+        if not values:
+            return np.empty((0, 0), dtype=np.float32)
+        dim = int.from_bytes(values[0][:2], "big")
+        packed = np.frombuffer(b"".join(values), dtype=">f4")
+        return packed.reshape(len(values), dim + 1)[:, 1:].astype(np.float32)
+
+    @classmethod
+    def _build(
+        cls, version: Optional[int], rows: list, sentence_rows: list
+    ) -> _IndexData:
+        job_ids = np.array([job_id for job_id, _, _ in rows], dtype=object)
+        company_ids = np.array(
+            [company_id for _, company_id, _ in rows], dtype=np.int64
+        )
+        if not rows:
+            return _IndexData(
+                version, job_ids, company_ids, np.empty((0, 0), dtype=np.float32)
+            )
+        matrix = cls._normalize(
+            cls._decode_vectors([embedding for _, _, embedding in rows])
+        )
+        if not sentence_rows:
+            return _IndexData(version, job_ids, company_ids, matrix)
+
+        sentences_by_job: dict = {}
+        for job_id, type_, sentence_index, embedding in sentence_rows:
+            sentences_by_job.setdefault(job_id, []).append(
+                ((type_, sentence_index), embedding)
+            )
+        starts = np.zeros(len(job_ids), dtype=np.int64)
+        ends = np.zeros(len(job_ids), dtype=np.int64)
+        ordered = []
+        sentence_keys = []
+        offset = 0
+        for i, job_id in enumerate(job_ids):
+            sentences = sentences_by_job.get(job_id, [])
+            starts[i] = offset
+            offset += len(sentences)
+            ends[i] = offset
+            for key, embedding in sentences:
+                sentence_keys.append(key)
+                ordered.append(embedding)
+        # 메모리를 줄이기 위해 float16으로 보관하고 계산할 때만 float32로 변환
+        sentence_matrix = cls._normalize(cls._decode_vectors(ordered)).astype(
+            np.float16
+        )
+        return _IndexData(
+            version,
+            job_ids,
+            company_ids,
+            matrix,
+            sentence_matrix,
+            starts,
+            ends,
+            sentence_keys,
+            {job_id: i for i, job_id in enumerate(job_ids)},
+        )
+
+    def _top(
+        self,
+        data: _IndexData,
+        query: List[float],
+        k: int,
+        exclude_company_ids: Optional[List[int]],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        vector = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        scores = data.matrix @ vector
+        valid_count = len(scores)
+        if exclude_company_ids:
+            excluded = np.isin(data.company_ids, exclude_company_ids)
+            scores[excluded] = -np.inf
+            valid_count -= int(excluded.sum())
+        k = min(k, valid_count)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), scores
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top])], scores
+
+    def search(
+        self,
+        query: List[float],
+        k: int,
+        exclude_company_ids: Optional[List[int]] = None,
+    ) -> list[tuple]:
+        """Return up to k (job_id, cosine_distance) pairs, nearest first.
+
+        Jobs of `exclude_company_ids` are masked out before top-k selection,
+        so exactly k results come back whenever k valid jobs exist.
+        """
+        data = self._data
+        if data is None or len(data.job_ids) == 0:
+            return []
+        top, scores = self._top(data, query, k, exclude_company_ids)
+        return [(data.job_ids[i], float(1 - scores[i])) for i in top]
+
+    def late_interaction_search(
+        self,
+        query: List[float],
+        sentence_queries: Union[np.ndarray, List[List[float]]],
+        k: int,
+        candidate_count: int,
+        exclude_company_ids: Optional[List[int]] = None,
+    ) -> list[tuple]:
+        """Return up to k (job_id, cosine_distance, maxsim_score), best MaxSim first.
+
+        The top `candidate_count` jobs by mean vector are re-scored with
+        MaxSim: for every resume sentence the best matching job sentence is
+        taken, and the scores are averaged over resume sentences. Jobs without
+        embedded sentences have no MaxSim score, so they follow the re-scored
+        jobs in mean-vector order with a None score.
+        """
+        data = self._data
+        if data is None or len(data.job_ids) == 0:
+            return []
+        top, scores = self._top(data, query, candidate_count, exclude_company_ids)
+        # 질의는 numpy 배열로도 들어오므로 진릿값 대신 길이로 확인
+        if data.sentence_matrix is None or len(top) == 0 or len(sentence_queries) == 0:
+            return [(data.job_ids[i], float(1 - scores[i]), None) for i in top[:k]]
+
+        queries = self._normalize(np.asarray(sentence_queries, dtype=np.float32))
+        starts = data.sentence_starts[top]
+        ends = data.sentence_ends[top]
+        lengths = ends - starts
+
+        # 평균 벡터 점수와 MaxSim 점수는 척도가 달라 문장이 없는 공고는 따로 정렬
+        has_sentences = lengths > 0
+        scored, unscored = top[has_sentences], top[~has_sentences]
+        results = []
+        if len(scored) > 0:
+            rows = np.concatenate(
+                [
+                    np.arange(start, end)
+                    for start, end in zip(starts[has_sentences], ends[has_sentences])
+                ]
+            )
+            similarities = data.sentence_matrix[rows].astype(np.float32) @ queries.T
+            segment_starts = np.concatenate(
+                ([0], np.cumsum(lengths[has_sentences])[:-1])
+            )
+            best = np.maximum.reduceat(similarities, segment_starts, axis=0)
+            maxsim = best.mean(axis=1)
+            results = [
+                (
+                    data.job_ids[scored[i]],
+                    float(1 - scores[scored[i]]),
+                    float(maxsim[i]),
+                )
+                for i in np.argsort(-maxsim)
+            ]
+        # top은 평균 벡터 점수 순이므로 그대로 뒤에 붙임
+        results.extend((data.job_ids[i], float(1 - scores[i]), None) for i in unscored)
+        return results[:k]
+
+    def sentence_relevance(
+        self, job_id, sentence_queries: Union[np.ndarray, List[List[float]]]
+    ) -> dict[tuple[str, int], float]:
+        """Score each embedded sentence of a job by its best resume-sentence match.
+
+        Keys are (type, sentence_index) as stored in job_qualification_sentences.
+        """
+        data = self._data
+        if data is None or data.sentence_matrix is None or len(sentence_queries) == 0:
+            return {}
+        position = data.job_positions.get(job_id)
+        if position is None:
+            return {}
+        start, end = data.sentence_starts[position], data.sentence_ends[position]
+        if start == end:
+            return {}
+        queries = self._normalize(np.asarray(sentence_queries, dtype=np.float32))
+        similarities = data.sentence_matrix[start:end].astype(np.float32) @ queries.T
+        scores = similarities.max(axis=1)
+        return {
+            data.sentence_keys[start + i]: float(score)
+            for i, score in enumerate(scores)
+        }
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.VECTOR_INDEX_REFRESH_INTERVAL)
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.logger.error("vector_index_refresh_failed", error=str(e))
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
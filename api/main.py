@@ -10,6 +10,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from uvicorn.protocols.utils import get_path_with_query_string
 from psycopg_pool import AsyncConnectionPool
 from core.graph import LangGraphAgent
+from core.snapshot import SnapshotCache
+from core.company_matcher import CompanyNameMatcher
+from core.pdf_extractor import ResumeExtractor
 from core.logging import setup_logging
 
 setup_logging(json_logs=settings.LOG_JSON_FORMAT, log_level=settings.LOG_LEVEL)
@@ -38,8 +41,20 @@ async def lifespan(app: FastAPI):
         max_lifetime=settings.POSTGRES_CONNECTION_MAX_LIFETIME,
         max_idle=settings.POSTGRES_CONNECTION_MAX_IDLE,
     )
+    app.state.snapshot_cache = SnapshotCache(
+        app.state.db_pool, settings.SNAPSHOT_VERSION_CHECK_INTERVAL
+    )
+    app.state.company_matcher = await CompanyNameMatcher.create(app.state.db_pool)
+    app.state.resume_extractor = ResumeExtractor(
+        max_workers=settings.RESUME_EXTRACT_WORKERS,
+        max_bytes=settings.RESUME_MAX_BYTES,
+        max_pages=settings.RESUME_MAX_PAGES,
+        pages_per_task=settings.RESUME_PAGES_PER_TASK,
+    )
     app.state.agent = await LangGraphAgent.create()
     yield
+    await app.state.company_matcher.close()
+    app.state.resume_extractor.close()
     await app.state.db_pool.close()
     await app.state.agent.close()
 
@@ -107,3 +122,16 @@ async def health_check():
     logger = structlog.stdlib.get_logger("chapchapai.health")
     logger.info("health_check_called")
     return {"status": "healthy", "version": "1.0.0"}
+
+
+@app.get("/health/checkpoints")
+async def checkpoint_retention_metrics(request: Request):
+    """Checkpoint retention metrics.
+
+    Returns:
+        dict: Thread count, oldest thread age and sweeper counters.
+    """
+    metrics = request.app.state.agent.checkpoint_retention_metrics()
+    if metrics is None:
+        return {"enabled": False}
+    return {"enabled": True, **metrics}
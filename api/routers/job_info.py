@@ -1,172 +1,228 @@
-from fastapi import APIRouter, Request
-from typing import List
+from fastapi import APIRouter, Request, Response, Query, HTTPException
+from typing import List, Literal, Optional
 from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 from collections import defaultdict
 from datetime import date, timedelta
+from core.config import settings
+from core.snapshot import SnapshotCache, snapshot_response
+import base64
+import json
+import uuid
 
 router = APIRouter()
 
 
-@router.get("/all_active", response_model=List[dict])
-async def get_all_active_job_info(
-    request: Request,
-):
-    job_query = """
-        SELECT
-        j.*,
-        c.name AS company_name,
-        ac.name AS affiliate_company_name,
-        ARRAY_REMOVE(ARRAY_AGG(t.name), NULL) AS tags
-        FROM chapchap.job_info j
-        JOIN chapchap.companies c ON j.company_id = c.id
-        JOIN chapchap.affiliate_companies ac ON j.affiliate_company_id = ac.id
-        LEFT JOIN chapchap.job_tags jt ON j.id = jt.job_id
-        LEFT JOIN chapchap.tags t ON jt.tag_id = t.id
-        WHERE j.is_active = true
-        GROUP BY j.id, c.name, ac.name
-        ORDER BY j.uploaded_date DESC;
-    """
+async def _snapshot_endpoint(request: Request, key: str, builder) -> Response:
+    snapshot_cache: SnapshotCache = request.app.state.snapshot_cache
+    snapshot = await snapshot_cache.get(key, lambda: builder(request.app.state.db_pool))
+    return snapshot_response(request, snapshot)
+
+
+def _add_upload_flags(job_dict: dict, today: date) -> dict:
+    uploaded_date = job_dict.get("uploaded_date")
+    job_dict["uploaded_in_a_week"] = (
+        uploaded_date is not None and uploaded_date >= today - timedelta(days=7)
+    )
+    job_dict["uploaded_in_a_day"] = (
+        uploaded_date is not None and uploaded_date >= today - timedelta(days=1)
+    )
+    return job_dict
 
-    qualifications_query = """
-        SELECT job_id, type, sentence_index, sentence
-        FROM chapchap.job_qualification_sentences
-        WHERE type != 'title'
-        ORDER BY job_id, type, sentence_index
+
+async def build_all_active_job_info(db_pool: AsyncConnectionPool) -> List[dict]:
+    job_query = """
+        SELECT *
+        FROM chapchap.job_read_model
+        WHERE is_active = true
+        ORDER BY uploaded_date DESC;
     """
 
-    async with request.app.state.db_pool.connection() as conn:
+    async with db_pool.connection() as conn:
         async with conn.cursor(row_factory=dict_row) as cur:
             await cur.execute(job_query)
             job_rows = await cur.fetchall()
 
-            await cur.execute(qualifications_query)
-            sentence_rows = await cur.fetchall()
+    today = date.today()
+    return [_add_upload_flags(dict(job), today) for job in job_rows]
 
-    qualifications_map = defaultdict(lambda: {"required": [], "preferred": []})
-    for row in sentence_rows:
-        qualifications_map[row["job_id"]][row["type"]].append(row["sentence"])
 
-    today = date.today()
-    one_week_ago = today - timedelta(days=7)
-
-    results = []
-    for job in job_rows:
-        job_dict = dict(job)
-        job_id = job_dict["id"]
-        job_dict["qualifications"] = qualifications_map[job_id]["required"]
-        job_dict["preferred_qualifications"] = qualifications_map[job_id]["preferred"]
-        uploaded_date = job_dict.get("uploaded_date")
-        job_dict["uploaded_in_a_week"] = (
-            uploaded_date is not None and uploaded_date >= one_week_ago
-        )
-        job_dict["uploaded_in_a_day"] = (
-            uploaded_date is not None and uploaded_date >= today - timedelta(days=1)
-        )
+@router.get("/all_active", response_model=List[dict])
+async def get_all_active_job_info(
+    request: Request,
+) -> Response:
+    return await _snapshot_endpoint(request, "all_active", build_all_active_job_info)
 
-        results.append(job_dict)
 
-    return results
+def _encode_cursor(uploaded_date: date, job_id) -> str:
+    raw = json.dumps([uploaded_date.isoformat(), str(job_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
 
 
-@router.get("/tag/job_count", response_model=List[dict])
-async def get_job_count_by_tag(
+def _decode_cursor(cursor: str) -> tuple[date, uuid.UUID]:
+    try:
+        uploaded_date, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return date.fromisoformat(uploaded_date), uuid.UUID(job_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+
+@router.get("/active", response_model=dict)
+async def get_active_job_info_page(
     request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(
+        default=settings.JOB_PAGE_SIZE, ge=1, le=settings.JOB_PAGE_MAX_SIZE
+    ),
+    tag: List[str] = Query(default=[]),
+    company: List[str] = Query(default=[]),
+    affiliate_company: List[str] = Query(default=[]),
+    view: Literal["full", "lite"] = "full",
 ):
-    query = """
-        SELECT
-            t.name AS tag_name,
-            COUNT(jt.job_id) AS job_count
-        FROM
-            chapchap.tags t
-        LEFT JOIN
-            chapchap.job_tags jt ON t.id = jt.tag_id
-        LEFT JOIN
-            chapchap.job_info j ON jt.job_id = j.id
-        WHERE
-            j.is_active = true
-        GROUP BY
-            t.name
-        ORDER BY
-            job_count DESC;
+    """Keyset-paginated active jobs ordered by (uploaded_date, id) descending.
+
+    `lite` view leaves out the long text columns and qualifications so the
+    first page stays small.
     """
+    columns = (
+        "*"
+        if view == "full"
+        else """
+        id,
+        job_title,
+        link,
+        uploaded_date,
+        company_id,
+        affiliate_company_id,
+        company_name,
+        affiliate_company_name,
+        tags
+        """
+    )
+    conditions = ["is_active = true"]
+    params: list = []
+    if tag:
+        conditions.append("tags && %s::text[]")
+        params.append(tag)
+    if company:
+        conditions.append("company_name = ANY(%s)")
+        params.append(company)
+    if affiliate_company:
+        conditions.append("affiliate_company_name = ANY(%s)")
+        params.append(affiliate_company)
+    if cursor:
+        cursor_date, cursor_id = _decode_cursor(cursor)
+        conditions.append("(uploaded_date, id) < (%s, %s::uuid)")
+        params.extend([cursor_date, cursor_id])
+
+    job_query = f"""
+        SELECT {columns}
+        FROM chapchap.job_read_model
+        WHERE {" AND ".join(conditions)}
+        ORDER BY uploaded_date DESC, id DESC
+        LIMIT %s
+    """
+    # 다음 페이지 존재 여부를 알기 위해 하나 더 조회
+    params.append(limit + 1)
+
     async with request.app.state.db_pool.connection() as conn:
         async with conn.cursor(row_factory=dict_row) as cur:
-            await cur.execute(query)
-            rows = await cur.fetchall()
-    return [dict(row) for row in rows]
+            await cur.execute(job_query, params)
+            job_rows = await cur.fetchall()
 
+    has_more = len(job_rows) > limit
+    job_rows = job_rows[:limit]
 
-@router.get("/company/job_count", response_model=List[dict])
-async def get_job_count_by_company(
-    request: Request,
-):
+    today = date.today()
+    results = [_add_upload_flags(dict(job), today) for job in job_rows]
+
+    next_cursor = (
+        _encode_cursor(job_rows[-1]["uploaded_date"], job_rows[-1]["id"])
+        if has_more
+        else None
+    )
+    return {"items": results, "next_cursor": next_cursor}
+
+
+async def build_job_count_facets(db_pool: AsyncConnectionPool) -> dict:
+    """Tag, company and affiliate job counts from a single GROUPING SETS pass."""
     query = """
         SELECT
-            c.name AS company_name,
-            COUNT(j.id) AS job_count
+            GROUPING(t.name) = 0 AS is_tag_facet,
+            GROUPING(j.affiliate_company_name) = 0 AS is_affiliate_facet,
+            t.name AS tag_name,
+            j.company_name,
+            j.affiliate_company_name,
+            j.parent_company_name,
+            COUNT(DISTINCT j.id) AS job_count
         FROM
-            chapchap.job_info j
-        JOIN
-            chapchap.companies c ON j.company_id = c.id
+            chapchap.job_read_model j
+        LEFT JOIN LATERAL
+            UNNEST(j.tags) AS t(name) ON true
         WHERE
             j.is_active = true
-        GROUP BY
-            c.name
-        ORDER BY
-            job_count DESC;
+        GROUP BY GROUPING SETS (
+            (t.name),
+            (j.company_name),
+            (j.affiliate_company_name, j.parent_company_name, j.company_name)
+        );
     """
-    async with request.app.state.db_pool.connection() as conn:
+    async with db_pool.connection() as conn:
         async with conn.cursor(row_factory=dict_row) as cur:
             await cur.execute(query)
             rows = await cur.fetchall()
-    return [dict(row) for row in rows]
 
+    tag_counts = []
+    company_counts = []
+    affiliate_counts = defaultdict(int)
+    for row in rows:
+        if row["is_tag_facet"]:
+            # 태그가 없는 공고는 태그 집계에서 제외
+            if row["tag_name"] is not None:
+                tag_counts.append(
+                    {"tag_name": row["tag_name"], "job_count": row["job_count"]}
+                )
+        elif row["is_affiliate_facet"]:
+            # 회사 이름과 같은 자회사는 본사로 취급
+            if row["affiliate_company_name"] != row["company_name"]:
+                key = (row["affiliate_company_name"], row["parent_company_name"])
+                affiliate_counts[key] += row["job_count"]
+        else:
+            company_counts.append(
+                {"company_name": row["company_name"], "job_count": row["job_count"]}
+            )
 
-@router.get("/affiliate_company/job_count", response_model=List[dict])
-async def get_job_count_by_affiliate_company(
-    request: Request,
-):
-    query = """
-        SELECT
-            ac.name AS affiliate_company_name,
-            pc.name AS parent_company_name,
-            COUNT(j.id) AS job_count
-        FROM
-            chapchap.job_info j
-        JOIN
-            chapchap.affiliate_companies ac ON j.affiliate_company_id = ac.id
-        JOIN
-            chapchap.companies c ON j.company_id = c.id
-        JOIN
-            chapchap.companies pc ON ac.parent_company_id = pc.id
-        WHERE
-            j.is_active = true AND
-            ac.name != c.name
-        GROUP BY
-            ac.name,
-            pc.name
-        ORDER BY
-            job_count DESC;
-    """
-    async with request.app.state.db_pool.connection() as conn:
-        async with conn.cursor(row_factory=dict_row) as cur:
-            await cur.execute(query)
-            rows = await cur.fetchall()
-    return [dict(row) for row in rows]
+    tag_counts.sort(key=lambda x: x["job_count"], reverse=True)
+    company_counts.sort(key=lambda x: x["job_count"], reverse=True)
+    affiliate_company_counts = sorted(
+        [
+            {
+                "affiliate_company_name": affiliate_name,
+                "parent_company_name": parent_name,
+                "job_count": job_count,
+            }
+            for (affiliate_name, parent_name), job_count in affiliate_counts.items()
+        ],
+        key=lambda x: x["job_count"],
+        reverse=True,
+    )
 
+    return {
+        "tag": tag_counts,
+        "company": company_counts,
+        "affiliate_company": affiliate_company_counts,
+        "company_including_affiliate_companies": merge_affiliate_company_counts(
+            company_counts, affiliate_company_counts
+        ),
+    }
 
-@router.get(
-    "/company/job_count_including_affiliate_companies", response_model=List[dict]
-)
-async def get_job_count_including_affiliate_companies(
-    request: Request,
-):
-    job_count_by_company = await get_job_count_by_company(request)
-    job_count_by_affiliate_company = await get_job_count_by_affiliate_company(request)
 
+def merge_affiliate_company_counts(
+    job_count_by_company: List[dict], job_count_by_affiliate_company: List[dict]
+) -> List[dict]:
     # 회사 이름을 키로 하는 딕셔너리 생성
     company_dict = {
-        company["company_name"]: company for company in job_count_by_company
+        company["company_name"]: {**company} for company in job_count_by_company
     }
 
     # 자회사 정보를 회사로 추가
@@ -195,3 +251,48 @@ async def get_job_count_including_affiliate_companies(
         job_count_by_all_companies.extend(sorted_affiliates)
 
     return job_count_by_all_companies
+
+
+async def _facet_endpoint(request: Request, facet: str) -> Response:
+    snapshot_cache: SnapshotCache = request.app.state.snapshot_cache
+
+    async def build_facet() -> List[dict]:
+        # 모든 집계 엔드포인트가 하나의 facet 스냅샷을 공유
+        facets = await snapshot_cache.get(
+            "job_count_facets",
+            lambda: build_job_count_facets(request.app.state.db_pool),
+        )
+        return facets.data[facet]
+
+    snapshot = await snapshot_cache.get(f"{facet}_job_count", build_facet)
+    return snapshot_response(request, snapshot)
+
+
+@router.get("/tag/job_count", response_model=List[dict])
+async def get_job_count_by_tag(
+    request: Request,
+) -> Response:
+    return await _facet_endpoint(request, "tag")
+
+
+@router.get("/company/job_count", response_model=List[dict])
+async def get_job_count_by_company(
+    request: Request,
+) -> Response:
+    return await _facet_endpoint(request, "company")
+
+
+@router.get("/affiliate_company/job_count", response_model=List[dict])
+async def get_job_count_by_affiliate_company(
+    request: Request,
+) -> Response:
+    return await _facet_endpoint(request, "affiliate_company")
+
+
+@router.get(
+    "/company/job_count_including_affiliate_companies", response_model=List[dict]
+)
+async def get_job_count_including_affiliate_companies(
+    request: Request,
+) -> Response:
+    return await _facet_endpoint(request, "company_including_affiliate_companies")
@@ -1,64 +1,21 @@
-import os
-from fastapi import APIRouter, Request, File, UploadFile, BackgroundTasks, Header
-from langchain_community.document_loaders import PyMuPDFLoader
+from fastapi import APIRouter, Request, File, UploadFile, HTTPException, Header
 import structlog
-from tempfile import NamedTemporaryFile
-from core.graph import LangGraphAgent
+from core.graph import LangGraphAgent, parse_summary_sentences
 from typing import List, Any
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
-from psycopg.rows import dict_row
-from psycopg_pool import AsyncConnectionPool
+from core.company_matcher import CompanyNameMatcher
 from core.config import settings
+from core.pdf_extractor import ResumeExtractor, ResumeExtractionError
 import json
 
 router = APIRouter()
 
 
-def remove_file(path: str) -> None:
-    os.remove(path)
-
-
-async def extract_named_experiences(
-    full_text: str, db_pool: AsyncConnectionPool
+def extract_named_experiences(
+    full_text: str, company_matcher: CompanyNameMatcher
 ) -> List[int]:
-    named_company_experiences = []
-    query = """
-        SELECT
-        company_id,
-        company_name,
-        ARRAY_AGG(name_variant ORDER BY name_variant) AS name_variants
-        FROM (
-        SELECT
-            c.id AS company_id,
-            c.name AS company_name,
-            c.name AS name_variant
-        FROM chapchap.companies c
-        UNION ALL
-        SELECT
-            c.id AS company_id,
-            c.name AS company_name,
-            can.alternate_name AS name_variant
-        FROM chapchap.companies c
-        JOIN chapchap.company_alternate_names can ON c.id = can.company_id
-        ) AS sub
-        GROUP BY company_id, company_name;
-    """
-    async with db_pool.connection() as conn:
-        async with conn.cursor(row_factory=dict_row) as cur:
-            await cur.execute(query)
-            company_names = await cur.fetchall()
-
-    for company_name_dict in company_names:
-        company_id = company_name_dict["company_id"]
-        company_name = company_name_dict["company_name"]
-        name_variants = company_name_dict["name_variants"]
-
-        if (company_name in full_text) or any(
-            name_variant in full_text for name_variant in name_variants
-        ):
-            named_company_experiences.append(company_id)
-            continue
-    return named_company_experiences
+    return company_matcher.find(full_text)
 
 
 async def update_agent_state(
@@ -66,62 +23,60 @@ async def update_agent_state(
     agent: LangGraphAgent,
     session_id,
 ) -> None:
-    summary = [
-        line.strip()[1:].strip().replace(" -> ", ", ").strip()
-        for line in summary.strip().split("\n")
-        if (line.strip() and line.startswith("- "))
-    ]
+    # 캐시된 요약을 재생한 세션은 마지막 체크포인트가 aupdate_state로 만들어져
+    # 노드를 추론할 수 없으므로 항상 resume_summary의 갱신으로 기록
     await agent.graph.aupdate_state(
         {"configurable": {"thread_id": session_id}},
-        {"summary_sentences": summary},
+        {"summary_sentences": parse_summary_sentences(summary)},
+        as_node="resume_summary",
     )
+    # 사용자가 요약을 읽는 동안 매칭을 미리 계산
+    if settings.MATCH_PRECOMPUTE_ENABLED:
+        agent.start_match(session_id)
 
 
 @router.post("/analyze", response_model=dict)
 async def analyze_resume(
     request: Request,
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
 ):
     session_id = request.headers.get("X-Session-Id")
     logger = structlog.get_logger("api.resume.analyze")
     logger.info("analyze_resume", session_id=session_id)
 
-    with NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
-        background_tasks.add_task(remove_file, tmp_path)
-
-    loader = PyMuPDFLoader(file_path=tmp_path)
-    documents = loader.load()
+    resume_extractor: ResumeExtractor = request.app.state.resume_extractor
+    # 제한보다 1바이트 더 읽어 크기 초과 여부를 판단
+    data = await file.read(settings.RESUME_MAX_BYTES + 1)
+    try:
+        full_text = (await resume_extractor.extract_text(data)).lower()
+    except ResumeExtractionError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
 
-    full_text = "\n".join(doc.page_content for doc in documents).lower()
-
-    named_company_experiences = await extract_named_experiences(
-        full_text, request.app.state.db_pool
+    named_company_experiences = extract_named_experiences(
+        full_text, request.app.state.company_matcher
     )
 
     agent: LangGraphAgent = request.app.state.agent
 
     await agent.clear_chat_history(session_id)
 
-    messages = agent.resume_summary_messages(full_text)
-
     async def generate_response():
         try:
             chunks = []
+            prefetcher = agent.summary_embedding_prefetcher()
             async for chunk in agent.stream_resume_summary(
-                messages, full_text, named_company_experiences, session_id
+                full_text, named_company_experiences, session_id
             ):
                 if chunk == settings.DONE_TOKEN:
                     chunk = ""
+                    prefetcher.finish()
                     await update_agent_state(
                         "".join(chunks),
                         agent,
                         session_id,
                     )
                 chunks.append(chunk)
+                prefetcher.feed(chunk)
                 yield f'{{"chunk": "{chunk}", "session_id": "{session_id}"}}'
         except Exception as e:
             yield json.dumps({"error": str(e)})
@@ -139,30 +94,31 @@ async def analyze_resume_raw(
 
     full_text = raw_resume.lower()
 
-    named_company_experiences = await extract_named_experiences(
-        full_text, request.app.state.db_pool
+    named_company_experiences = extract_named_experiences(
+        full_text, request.app.state.company_matcher
     )
 
     agent: LangGraphAgent = request.app.state.agent
 
     await agent.clear_chat_history(session_id)
 
-    messages = agent.resume_summary_messages(full_text)
-
     async def generate_response():
         try:
             chunks = []
+            prefetcher = agent.summary_embedding_prefetcher()
             async for chunk in agent.stream_resume_summary(
-                messages, full_text, named_company_experiences, session_id
+                full_text, named_company_experiences, session_id
             ):
                 if chunk == settings.DONE_TOKEN:
                     chunk = ""
+                    prefetcher.finish()
                     await update_agent_state(
                         "".join(chunks),
                         agent,
                         session_id,
                     )
                 chunks.append(chunk)
+                prefetcher.feed(chunk)
                 yield f'{{"chunk": "{chunk}", "session_id": "{session_id}"}}'
         except Exception as e:
             yield json.dumps({"error": str(e)})
@@ -174,13 +130,22 @@ async def analyze_resume_raw(
 async def match_job(request: Request):
     session_id = request.headers.get("X-Session-Id")
     agent: LangGraphAgent = request.app.state.agent
-    agent_thread_config = {"configurable": {"thread_id": session_id}}
-    state = await agent.graph.ainvoke(None, agent_thread_config)
+    return await agent.match_jobs(session_id)
 
-    if state["is_valid_resume"] is False:
-        return []
 
-    return state["reranked_results"]
+@router.get("/match_job/stream")
+async def match_job_stream(request: Request):
+    session_id = request.headers.get("X-Session-Id")
+    agent: LangGraphAgent = request.app.state.agent
+
+    async def generate_response():
+        try:
+            async for event in agent.stream_match_jobs(session_id):
+                yield json.dumps(jsonable_encoder(event), ensure_ascii=False) + "\n"
+        except Exception as e:
+            yield json.dumps({"type": "error", "error": str(e)}) + "\n"
+
+    return StreamingResponse(generate_response(), media_type="application/x-ndjson")
 
 
 @router.get("/generate_cover_letter/{job_id}", response_model=dict)
@@ -0,0 +1,46 @@
+import asyncio
+
+from core.cache import TTLCache
+from core.match_run import MatchRun
+
+
+def test_on_evict_for_size_expiry_and_overwrite(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("core.cache.time.monotonic", lambda: now[0])
+    evicted = []
+    cache = TTLCache(max_size=2, ttl=10, on_evict=lambda k, v: evicted.append(k))
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert evicted == ["a"]
+
+    cache.set("b", 4)
+    assert evicted == ["a", "b"]
+
+    now[0] = 11
+    assert cache.get("c") is None
+    assert evicted == ["a", "b", "c"]
+
+    # pop은 호출한 쪽이 값을 정리하므로 콜백을 호출하지 않음
+    assert cache.pop("b") == 4
+    assert evicted == ["a", "b", "c"]
+
+
+def test_evicted_match_run_is_cancelled():
+    async def endless():
+        while True:
+            await asyncio.sleep(1)
+            yield {"type": "tick"}
+
+    async def scenario():
+        cache = TTLCache(max_size=1, on_evict=lambda _, run: run.cancel())
+        first = MatchRun("session-1", endless())
+        cache.set("session-1", first)
+        cache.set("session-2", MatchRun("session-2", endless()))
+        # 시작 전에 취소되어도 구독자는 종료를 받음
+        assert [event async for event in first.subscribe()] == []
+        assert first._task.cancelled()
+        cache.pop("session-2").cancel()
+
+    asyncio.run(scenario())
@@ -0,0 +1,48 @@
+import asyncio
+
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.memory import InMemorySaver
+
+from core.checkpointer import TTLMemorySaver
+
+
+class GatedSaver(InMemorySaver):
+    """Durable saver whose first write blocks until `release` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        if not self.started.is_set():
+            self.started.set()
+            await self.release.wait()
+        return await super().aput(config, checkpoint, metadata, new_versions)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def test_forget_drops_writes_of_a_running_flush():
+    async def scenario():
+        durable = GatedSaver()
+        saver = TTLMemorySaver(ttl=60, max_threads=10, durable=durable)
+        saver._flush_task.cancel()
+        for thread_id in ("a", "b", "b"):
+            await saver.aput(_config(thread_id), empty_checkpoint(), {}, {})
+
+        flush = asyncio.create_task(saver.flush())
+        await durable.started.wait()
+        # 첫 쓰기가 내보내지는 동안 스레드 b를 지움
+        forget = asyncio.create_task(saver.forget("b"))
+        await asyncio.sleep(0)
+        durable.release.set()
+        await asyncio.gather(flush, forget)
+
+        assert durable.get_tuple(_config("a")) is not None
+        assert durable.get_tuple(_config("b")) is None
+        assert saver._queue == [] and saver._in_flight == []
+
+    asyncio.run(scenario())
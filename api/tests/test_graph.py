@@ -0,0 +1,171 @@
+import asyncio
+import json
+import os
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGenerationChunk
+from langgraph.checkpoint.memory import InMemorySaver
+
+import core.graph
+from core.config import settings
+from core.graph import LangGraphAgent
+from routers.resume import update_agent_state
+
+SUMMARY = "- Python 백엔드 개발 5년\n- 대규모 트래픽 서비스 운영\n"
+RESUME_TEXT = "python backend engineer resume"
+
+
+class RecordingChatModel(GenericFakeChatModel):
+    """Streams like GenericFakeChatModel and counts the chunks sent so far."""
+
+    streamed: int = 0
+    done: bool = False
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        for chunk in self._stream(messages, stop=stop, **kwargs):
+            self.streamed += 1
+            yield chunk
+            await asyncio.sleep(0)
+        self.done = True
+
+
+def _job(i: int) -> dict:
+    return {
+        "id": f"job-{i}",
+        "job_title": f"Backend Engineer {i}",
+        "company_name": "회사",
+        "team_info": "팀 소개",
+        "responsibilities": ["API 개발"],
+        "qualifications": ["Python 경험"],
+        "preferred_qualifications": [],
+    }
+
+
+async def _create_agent() -> LangGraphAgent:
+    agent = LangGraphAgent()
+    agent.model = GenericFakeChatModel(messages=iter([AIMessage(content=SUMMARY)]))
+
+    async def create_checkpointer():
+        return InMemorySaver()
+
+    agent._create_checkpointer = create_checkpointer
+    await agent._create_graph()
+    return agent
+
+
+async def _analyze(agent: LangGraphAgent, session_id: str) -> str:
+    chunks = []
+    async for chunk in agent.stream_resume_summary(RESUME_TEXT, [], session_id):
+        if chunk == settings.DONE_TOKEN:
+            await update_agent_state("".join(chunks), agent, session_id)
+            continue
+        chunks.append(chunk)
+    return "".join(chunks)
+
+
+def test_summary_cache_hit_on_new_session(monkeypatch):
+    monkeypatch.setattr(settings, "MATCH_PRECOMPUTE_ENABLED", False)
+
+    async def scenario():
+        agent = await _create_agent()
+        first = await _analyze(agent, "session-1")
+        # 같은 이력서로 새 세션을 시작하면 LLM 없이 캐시된 요약을 재생
+        second = await _analyze(agent, "session-2")
+
+        for session_id in ("session-1", "session-2"):
+            state = await agent.graph.aget_state(
+                {"configurable": {"thread_id": session_id}}
+            )
+            assert state.next == ("validate_resume",)
+            # 이력서 원문은 resume_text에만 남고 메시지에는 요약 응답만 저장
+            assert state.values["resume_text"] == RESUME_TEXT
+            assert [m.content for m in state.values["messages"]] == [SUMMARY]
+            assert state.values["summary_sentences"] == [
+                "Python 백엔드 개발 5년",
+                "대규모 트래픽 서비스 운영",
+            ]
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second == SUMMARY
+
+
+def test_rerank_emits_jobs_while_the_model_is_streaming(monkeypatch):
+    reranked = {
+        "results": [
+            {"job_idx": 2, "job_title": "Backend Engineer 2", "reason": "파이썬 경력"},
+            {"job_idx": 0, "job_title": "Backend Engineer 0", "reason": "API 경험"},
+        ]
+    }
+    model = RecordingChatModel(
+        messages=iter([AIMessage(content=json.dumps(reranked, ensure_ascii=False))])
+    )
+    events = []
+
+    def writer(event):
+        events.append((event, model.streamed, model.done))
+
+    monkeypatch.setattr(core.graph, "get_stream_writer", lambda: writer)
+
+    async def scenario():
+        agent = LangGraphAgent()
+        agent.model = model
+        jobs = [_job(i) for i in range(3)]
+
+        async def hydrate_jobs(refs):
+            return jobs
+
+        agent._hydrate_jobs = hydrate_jobs
+        return await agent._rerank_matches(
+            {"retrieved_jobs": [], "summary_sentences": ["Python 백엔드 개발 5년"]}
+        )
+
+    output = asyncio.run(scenario())
+
+    assert [ref["id"] for ref in output["reranked_results"]] == ["job-2", "job-0"]
+    first_event, streamed, done = events[0]
+    assert first_event["reranked_job"]["reason"] == "파이썬 경력"
+    # 첫 항목은 모델이 나머지를 생성하는 동안 이미 전달됨
+    assert not done and streamed < model.streamed
+
+
+def test_stream_match_jobs_hydrates_buffered_refs():
+    async def events():
+        yield {
+            "type": "candidates",
+            "jobs": [{"id": "job-0", "cosine_similarity": 0.9}],
+        }
+        yield {"type": "reranked", "job": {"id": "job-0", "reason": "API 경험"}}
+        yield {"type": "reranked", "job": {"id": "job-1", "reason": "파이썬 경력"}}
+        yield {"type": "done"}
+
+    async def scenario():
+        agent = LangGraphAgent()
+        hydrated_ids = []
+
+        async def hydrate_jobs(refs):
+            hydrated_ids.append([ref["id"] for ref in refs])
+            return [
+                LangGraphAgent._merge_ref(_job(int(ref["id"][-1])), ref) for ref in refs
+            ]
+
+        agent._hydrate_jobs = hydrate_jobs
+        agent._match_events = lambda session_id: events()
+        streamed = [event async for event in agent.stream_match_jobs("session-1")]
+        # 버퍼에는 id와 점수만 남고 공고 본문은 없음
+        run = agent._match_runs.get("session-1")
+        assert "job_title" not in run.events[0]["jobs"][0]
+        return streamed, hydrated_ids
+
+    streamed, hydrated_ids = asyncio.run(scenario())
+
+    assert hydrated_ids == [["job-0"], ["job-1"]]
+    assert streamed[0]["jobs"][0]["cosine_similarity"] == 0.9
+    assert streamed[1]["job"]["job_title"] == "Backend Engineer 0"
+    assert streamed[1]["job"]["reason"] == "API 경험"
+    assert streamed[2]["job"]["reason"] == "파이썬 경력"
+    assert streamed[3] == {"type": "done"}
@@ -0,0 +1,96 @@
+import struct
+import uuid
+
+import numpy as np
+import pytest
+
+from core.vector_index import JobVectorIndex
+
+
+def _pgvector(values: list[float]) -> bytes:
+    # pgvector의 바이너리 전송 형식: int16 차원, int16 예약, float4 성분
+    return struct.pack(f">hh{len(values)}f", len(values), 0, *values)
+
+
+def test_build_decodes_binary_vectors():
+    job_a, job_b = uuid.uuid4(), uuid.uuid4()
+    rows = [
+        (job_a, 1, _pgvector([3.0, 4.0, 0.0])),
+        (job_b, 2, _pgvector([0.0, 0.0, 2.0])),
+    ]
+    sentence_rows = [
+        (job_a, "required", 0, _pgvector([1.0, 0.0, 0.0])),
+        (job_a, "required", 1, _pgvector([0.0, 5.0, 0.0])),
+    ]
+
+    data = JobVectorIndex._build(7, rows, sentence_rows)
+
+    assert data.matrix.dtype == np.float32
+    np.testing.assert_allclose(data.matrix, [[0.6, 0.8, 0.0], [0.0, 0.0, 1.0]])
+    np.testing.assert_allclose(
+        data.sentence_matrix.astype(np.float32), [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+    )
+    assert list(data.sentence_starts) == [0, 2]
+    assert list(data.sentence_ends) == [2, 2]
+    assert data.sentence_keys == [("required", 0), ("required", 1)]
+
+
+def test_build_without_rows():
+    data = JobVectorIndex._build(None, [], [])
+
+    assert len(data.job_ids) == 0
+    assert data.matrix.shape == (0, 0)
+
+
+def test_late_interaction_ranks_jobs_without_sentences_last():
+    job_a, job_b, job_c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    rows = [
+        (job_a, 1, _pgvector([1.0, 0.0, 0.0])),
+        (job_b, 2, _pgvector([0.9, 0.1, 0.0])),
+        (job_c, 3, _pgvector([0.8, 0.0, 0.2])),
+    ]
+    sentence_rows = [
+        (job_b, "preferred", 0, _pgvector([0.0, 1.0, 0.0])),
+        (job_c, "required", 0, _pgvector([0.0, 0.0, 1.0])),
+    ]
+    index = JobVectorIndex(db_pool=None, load_sentences=True)
+    index._data = JobVectorIndex._build(1, rows, sentence_rows)
+
+    results = index.late_interaction_search(
+        [1.0, 0.0, 0.0], [[0.0, 0.0, 1.0]], k=3, candidate_count=3
+    )
+
+    # job_a는 평균 벡터 점수가 가장 높지만 문장이 없어 MaxSim 순위 뒤로 감
+    assert [job_id for job_id, _, _ in results] == [job_c, job_b, job_a]
+    assert results[0][2] == pytest.approx(1.0)
+    assert results[2][2] is None
+
+
+def test_sentence_scoring_accepts_an_ndarray_query_matrix():
+    job_a, job_b = uuid.uuid4(), uuid.uuid4()
+    rows = [
+        (job_a, 1, _pgvector([1.0, 0.0, 0.0])),
+        (job_b, 2, _pgvector([0.0, 1.0, 0.0])),
+    ]
+    sentence_rows = [
+        (job_a, "preferred", 0, _pgvector([0.0, 1.0, 0.0])),
+        (job_a, "required", 0, _pgvector([1.0, 0.0, 0.0])),
+        (job_b, "required", 0, _pgvector([0.0, 0.0, 1.0])),
+    ]
+    index = JobVectorIndex(db_pool=None, load_sentences=True)
+    index._data = JobVectorIndex._build(1, rows, sentence_rows)
+    # _sentence_embeddings가 돌려주는 것과 같은 (문장 수, 차원) 배열
+    queries = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32)
+
+    results = index.late_interaction_search(
+        [0.5, 0.5, 0.0], queries, k=2, candidate_count=2
+    )
+    relevance = index.sentence_relevance(job_a, queries)
+
+    assert [job_id for job_id, _, _ in results] == [job_a, job_b]
+    assert results[0][2] == pytest.approx(1.0)
+    assert relevance == {
+        ("preferred", 0): pytest.approx(1.0),
+        ("required", 0): pytest.approx(1.0),
+    }
+    assert index.sentence_relevance(job_a, np.empty((0, 3))) == {}
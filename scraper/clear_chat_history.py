@@ -1,30 +1,37 @@
 import os
 import logging
 from dotenv import load_dotenv
-import psycopg
-from util import DB_CONFIG
+from util import db_connection
 
 load_dotenv(dotenv_path=".env.production")
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
-CHECKPOINT_TABLES = [
-    "checkpoint_blobs",
-    "checkpoint_writes",
-    "checkpoints",
-]
+CHECKPOINT_RETENTION_TTL = int(os.getenv("CHECKPOINT_RETENTION_TTL", "86400"))
+CHECKPOINT_SWEEP_BATCH_SIZE = int(os.getenv("CHECKPOINT_SWEEP_BATCH_SIZE", "100"))
 
 
-def drop_vector_index():
-    with psycopg.connect(**DB_CONFIG) as conn:
+def expire_chat_history():
+    # 전체 삭제 대신 보존 기간이 지난 세션만 작은 배치로 나눠 삭제
+    expired = 0
+    with db_connection() as conn:
         with conn.cursor() as cur:
-            for table in CHECKPOINT_TABLES:
+            while True:
                 cur.execute(
-                    f"""
-                    DELETE FROM chapchap.{table}
                     """
+                    SELECT chapchap.expire_checkpoint_threads(
+                        make_interval(secs => %s), %s
+                    )
+                    """,
+                    (CHECKPOINT_RETENTION_TTL, CHECKPOINT_SWEEP_BATCH_SIZE),
                 )
-        conn.commit()
+                batch_expired = cur.fetchone()[0]
+                # 배치마다 커밋해 잠금을 짧게 유지
+                conn.commit()
+                expired += batch_expired
+                if batch_expired < CHECKPOINT_SWEEP_BATCH_SIZE:
+                    break
+    logging.info(f"만료된 대화 세션 {expired}개 삭제 완료")
 
 
 if __name__ == "__main__":
-    drop_vector_index()
+    expire_chat_history()
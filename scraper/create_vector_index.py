@@ -1,16 +1,15 @@
 import os
 import logging
 from dotenv import load_dotenv
-import psycopg
 from pgvector.psycopg import register_vector
-from util import DB_CONFIG
+from util import db_connection
 
 load_dotenv(dotenv_path=".env.production")
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
 
 def create_vector_index():
-    with psycopg.connect(**DB_CONFIG) as conn:
+    with db_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(f"SET search_path TO {os.getenv('DB_SCHEMA', 'chapchap')}")
             cur.execute("CREATE EXTENSION IF NOT EXISTS vector;")
@@ -1,16 +1,9 @@
 import logging
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from typing import List, Dict
 from datetime import datetime
-from util import (
-    get_env_vars,
-    save_job_info,
-    JobInfo,
-    DEFAULT_HEADERS,
-    extract_structured_data_with_gemini,
-)
+from engine import AsyncFetcher, Site, run_site
 import json
 
 # --- 기본 설정 ---
@@ -22,12 +15,10 @@ JOBS_BASE_URL = "https://careers.devsisters.com"
 
 
 # --- 스크래핑 관련 함수 ---
-def scrape_jobs(session: requests.Session) -> List[Dict[str, str]]:
+async def scrape_jobs(fetcher: AsyncFetcher) -> List[Dict]:
     """채용 공고 리스트를 스크래핑합니다."""
     params = {"occupations": "개발"}
-    res = session.get(
-        f"{JOBS_BASE_URL}/position", params=params, headers=DEFAULT_HEADERS
-    )
+    res = await fetcher.get(f"{JOBS_BASE_URL}/position", params=params)
     res.encoding = "utf-8"  # 응답 인코딩을 UTF-8로 설정
     soup = BeautifulSoup(res.text, "html.parser", from_encoding="utf-8")
 
@@ -50,9 +41,10 @@ def scrape_jobs(session: requests.Session) -> List[Dict[str, str]]:
         job_id = job_raw_data["openingId"]
         job_title = job_raw_data["title"]
         job_link = f"{JOBS_BASE_URL}/o/{job_id}"
-        uploaded_date = job_raw_data["openingJobPosition"]["openingJobPositionSetting"][
+        created_at = job_raw_data["openingJobPosition"]["openingJobPositionSetting"][
             "createdAt"
-        ].split("T")[0]
+        ]
+        uploaded_date = datetime.strptime(created_at.split("T")[0], "%Y-%m-%d").date()
         jobs.append(
             {"title": job_title, "link": job_link, "uploaded_date": uploaded_date}
         )
@@ -60,54 +52,31 @@ def scrape_jobs(session: requests.Session) -> List[Dict[str, str]]:
     return jobs
 
 
-def scrape_job_detail(session: requests.Session, url: str) -> str:
+async def scrape_job_detail(fetcher: AsyncFetcher, job: Dict) -> Dict:
     """상세 채용 공고 내용을 스크래핑합니다."""
-    res = session.get(url, headers=DEFAULT_HEADERS)
+    res = await fetcher.get(job["link"])
     soup = BeautifulSoup(res.content, "html.parser")
     detail_wrap = soup.find("div", class_="detail")
 
-    return (
+    detail = (
         detail_wrap.get_text(separator="\n", strip=True)
         if detail_wrap
         else "상세 내용 없음"
     )
+    return {"detail": detail}
 
 
 # --- 메인 실행 ---
-def main():
-    api_key, model_type, test_mode = get_env_vars(
-        "GOOGLE_API_KEY", "GEMINI_SYNTHETIC_DATA_GENERATION_MODEL", "TEST_MODE"
-    )
-    test_mode = test_mode == "1"
-    session = requests.Session()
-    company_name = "데브시스터즈"
-    alternate_names = ["devsisters"]
-
-    jobs = scrape_jobs(session)
-    logging.info(f"총 {len(jobs)}건 추출했습니다.")
-
-    for idx, job in enumerate(jobs, 1):
-        logging.info(f"공고 처리 중... ({idx}/{len(jobs)})")
-        logging.info(f"공고: {job['title']} - {job['link']}")
-        detail_text = scrape_job_detail(session, job["link"])
-
-        logging.info("Gemini를 통해 구조화된 데이터 추출 중...")
-        job_info_response = extract_structured_data_with_gemini(
-            company_name, detail_text, api_key, model_type
-        )
-        job_info = JobInfo(
-            company_name=company_name,
-            affiliate_company_name=company_name,
-            link=job["link"],
-            job_title=job["title"],
-            uploaded_date=datetime.strptime(job["uploaded_date"], "%Y-%m-%d").date(),
-            **job_info_response.model_dump(),
-        )
+SITE = Site(
+    company_name="데브시스터즈",
+    alternate_names=["devsisters"],
+    scrape_jobs=scrape_jobs,
+    scrape_job_detail=scrape_job_detail,
+)
 
-        save_job_info(job_info, alternate_names, test_mode)
 
-        if test_mode:
-            break
+def main():
+    run_site(SITE)
 
 
 if __name__ == "__main__":
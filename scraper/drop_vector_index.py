@@ -1,15 +1,14 @@
 import os
 import logging
 from dotenv import load_dotenv
-import psycopg
-from util import DB_CONFIG
+from util import db_connection
 
 load_dotenv(dotenv_path=".env.production")
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
 
 def drop_vector_index():
-    with psycopg.connect(**DB_CONFIG) as conn:
+    with db_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 "DROP INDEX IF EXISTS chapchap.idx_job_qualification_sentences_embedding"
@@ -1,11 +1,10 @@
 import logging
 from dotenv import load_dotenv
-import psycopg
 from openai import OpenAI
 import numpy as np
 from typing import List
 from collections import defaultdict
-from util import DB_CONFIG
+from util import db_connection
 import time
 
 load_dotenv(dotenv_path=".env.production")
@@ -47,8 +46,7 @@ def embed_and_store_sentences():
 
     job_sentences = defaultdict(list)
 
-    with psycopg.connect(**DB_CONFIG) as conn:
-        conn.autocommit = False
+    with db_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(query)
             rows = cur.fetchall()
@@ -110,6 +108,19 @@ def embed_and_store_sentences():
                     conn.rollback()
                     logging.error(f"❌ {job_id} 처리 중 오류 발생: {e}")
 
+            # API의 인메모리 벡터 인덱스가 다시 로드하도록 버전 갱신
+            cur.execute(
+                """
+                INSERT INTO chapchap.index_versions (name, version, published_at)
+                VALUES ('job_embeddings', 1, NOW())
+                ON CONFLICT (name) DO UPDATE SET
+                    version = chapchap.index_versions.version + 1,
+                    published_at = NOW()
+                """
+            )
+            conn.commit()
+            logging.info("job_embeddings 버전 갱신 완료")
+
 
 if __name__ == "__main__":
     embed_and_store_sentences()
@@ -0,0 +1,242 @@
+import os
+import asyncio
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+from dotenv import load_dotenv
+import httpx
+from util import (
+    get_env_vars,
+    save_job_info,
+    JobInfo,
+    DEFAULT_HEADERS,
+    get_extraction_pool,
+    source_text_hash,
+    find_unchanged_jobs,
+    touch_jobs,
+    touch_unchanged_job,
+)
+
+# --- 기본 설정 ---
+load_dotenv(dotenv_path=".env.production")
+logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# --- 상수 ---
+HOST_CONCURRENCY = int(os.getenv("SCRAPER_HOST_CONCURRENCY", "4"))
+HOST_REQUEST_INTERVAL = float(os.getenv("SCRAPER_HOST_REQUEST_INTERVAL", "0.2"))
+REQUEST_TIMEOUT = float(os.getenv("SCRAPER_REQUEST_TIMEOUT", "20"))
+MAX_RETRIES = int(os.getenv("SCRAPER_MAX_RETRIES", "3"))
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+# --- HTTP 클라이언트 ---
+class HostLimiter:
+    """호스트별 동시 요청 수와 요청 시작 간격을 제한합니다."""
+
+    def __init__(self, concurrency: int, interval: float):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+
+
+class AsyncFetcher:
+    """사이트 스크래퍼가 공유하는 HTTP 클라이언트.
+
+    keep-alive 연결을 재사용하고 호스트별 동시 요청 수와 요청 간격, 타임아웃,
+    429/5xx 응답과 연결 오류에 대한 지수 백오프 재시도를 적용합니다. 재시도 후에도
+    성공하지 못한 응답은 httpx.HTTPStatusError로 올립니다.
+    """
+
+    def __init__(
+        self,
+        host_concurrency: int = HOST_CONCURRENCY,
+        host_request_interval: float = HOST_REQUEST_INTERVAL,
+        timeout: float = REQUEST_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+    ):
+        self._client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=timeout,
+            follow_redirects=True,
+        )
+        self._host_concurrency = host_concurrency
+        self._host_request_interval = host_request_interval
+        self._max_retries = max_retries
+        self._limiters: Dict[str, HostLimiter] = {}
+
+    def _limiter(self, url: str) -> HostLimiter:
+        host = urlsplit(url).netloc
+        if host not in self._limiters:
+            self._limiters[host] = HostLimiter(
+                self._host_concurrency, self._host_request_interval
+            )
+        return self._limiters[host]
+
+    async def get(
+        self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None
+    ) -> httpx.Response:
+        limiter = self._limiter(url)
+        for attempt in range(self._max_retries + 1):
+            retry_after = None
+            async with limiter:
+                try:
+                    res = await self._client.get(url, params=params, headers=headers)
+                except httpx.TransportError as e:
+                    if attempt == self._max_retries:
+                        raise
+                    logging.warning(
+                        f"요청 실패, 재시도 중... ({attempt + 1}) {url}: {e}"
+                    )
+                else:
+                    if (
+                        res.status_code not in RETRY_STATUS_CODES
+                        or attempt == self._max_retries
+                    ):
+                        # 오류 페이지가 공고 본문으로 저장되지 않도록 예외로 처리
+                        res.raise_for_status()
+                        return res
+                    logging.warning(
+                        f"응답 {res.status_code}, 재시도 중... ({attempt + 1}) {url}"
+                    )
+                    retry_after = res.headers.get("Retry-After")
+            delay = 0.5 * 2**attempt
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+# --- 사이트 실행 ---
+@dataclass
+class Site:
+    """사이트 모듈은 공고 목록과 상세 페이지를 가져오는 방법만 선언합니다.
+
+    scrape_jobs는 title, link와 선택적으로 affiliate_company_name, uploaded_date,
+    detail을 가진 dict 목록을 반환합니다. scrape_job_detail은 공고 하나를 받아
+    detail과 선택적으로 uploaded_date를 담은 dict를 반환하며, 목록에 detail이
+    이미 있는 사이트는 생략합니다.
+    """
+
+    company_name: str
+    alternate_names: List[str]
+    scrape_jobs: Callable[[AsyncFetcher], Awaitable[List[Dict]]]
+    scrape_job_detail: Optional[Callable[[AsyncFetcher, Dict], Awaitable[Dict]]] = None
+
+
+async def fetch_details(site: Site, fetcher: AsyncFetcher, jobs: List[Dict]):
+    """상세 페이지를 동시에 가져오며, 끝나는 순서대로 공고를 내보냅니다."""
+
+    async def fetch(job: Dict) -> Dict:
+        try:
+            return {**job, **await site.scrape_job_detail(fetcher, job)}
+        except Exception as e:
+            logging.error(f"상세 페이지 요청 실패: {job['link']} - {e}")
+            return {**job, "detail": None}
+
+    if site.scrape_job_detail is None:
+        for job in jobs:
+            yield job
+        return
+
+    for future in asyncio.as_completed([fetch(job) for job in jobs]):
+        yield await future
+
+
+async def process_job(site: Site, job: Dict, test_mode: bool) -> str:
+    """공고 하나를 추출해 저장하고 처리 결과(saved, unchanged, skipped)를 반환합니다."""
+    if not job.get("detail"):
+        logging.warning(f"상세 내용이 없어 건너뜁니다: {job['link']}")
+        return "skipped"
+
+    extraction_pool = get_extraction_pool()
+    source_hash = source_text_hash(site.company_name, job["title"], job["detail"])
+    if not test_mode and await asyncio.to_thread(
+        touch_unchanged_job,
+        job["link"],
+        source_hash,
+        extraction_pool.prompt_version,
+        job.get("uploaded_date"),
+    ):
+        logging.info(f"변경 없는 공고라 추출을 건너뜁니다: {job['link']}")
+        return "unchanged"
+
+    job_info_response = await asyncio.wrap_future(
+        extraction_pool.submit(site.company_name, job["detail"])
+    )
+    if job_info_response is None:
+        return "skipped"
+    job_info = JobInfo(
+        company_name=site.company_name,
+        affiliate_company_name=job.get("affiliate_company_name", site.company_name),
+        link=job["link"],
+        job_title=job["title"],
+        uploaded_date=job.get("uploaded_date"),
+        source_hash=source_hash,
+        prompt_version=extraction_pool.prompt_version,
+        **job_info_response.model_dump(),
+    )
+    await asyncio.to_thread(save_job_info, job_info, site.alternate_names, test_mode)
+    return "saved"
+
+
+async def run_site_async(site: Site):
+    test_mode = get_env_vars("TEST_MODE") == "1"
+    start_time = time.perf_counter()
+    fetcher = AsyncFetcher()
+    try:
+        listed_jobs = await site.scrape_jobs(fetcher)
+        logging.info(f"총 {len(listed_jobs)}건 추출했습니다.")
+        if test_mode:
+            listed_jobs = listed_jobs[:1]
+
+        # 목록 정보가 그대로인 공고는 상세 페이지를 요청하지 않고 updated_at만 갱신.
+        # 목록에 상세 내용이 있는 공고는 process_job에서 원문 해시로 비교
+        listing_only = [job for job in listed_jobs if not job.get("detail")]
+        unchanged = set()
+        if not test_mode and listing_only:
+            unchanged = await asyncio.to_thread(
+                find_unchanged_jobs, listing_only, get_extraction_pool().prompt_version
+            )
+        if unchanged:
+            await asyncio.to_thread(touch_jobs, list(unchanged))
+            logging.info(f"목록 정보가 같은 공고 {len(unchanged)}건은 건너뜁니다.")
+        jobs = [job for job in listed_jobs if job["link"] not in unchanged]
+
+        # 상세 페이지가 도착하는 대로 추출 풀에 넘기고, 동시 호출 수와 한도는 풀이 관리
+        tasks = []
+        async for job in fetch_details(site, fetcher, jobs):
+            logging.info(f"공고 처리 중... ({len(tasks) + 1}/{len(jobs)})")
+            logging.info(f"공고: {job['title']} - {job['link']}")
+            tasks.append(asyncio.create_task(process_job(site, job, test_mode)))
+        results = Counter(await asyncio.gather(*tasks))
+        results["unchanged"] += len(unchanged)
+    finally:
+        await fetcher.aclose()
+    logging.info(
+        f"{site.company_name} 공고 {len(listed_jobs)}건 처리 완료 "
+        f"(저장 {results['saved']}건, 변경 없음 {results['unchanged']}건, "
+        f"건너뜀 {results['skipped']}건, {time.perf_counter() - start_time:.1f}초)"
+    )
+
+
+def run_site(site: Site):
+    asyncio.run(run_site_async(site))
@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+from dotenv import load_dotenv
+
+import baemin
+import clear_chat_history
+import coupang
+import create_vector_index
+import daangn
+import devsisters
+import drop_vector_index
+import embedder
+import flipster
+import hpcnt
+import hyperithm
+import kakao
+import line
+import naver
+import tagger
+from engine import Site, run_site
+
+# --- 기본 설정 ---
+load_dotenv(dotenv_path=".env.production")
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(levelname)s] [%(threadName)s] %(message)s",
+    force=True,
+)
+
+
+# --- 파이프라인 정의 ---
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[], None]
+    deps: List[str] = field(default_factory=list)
+    # False면 실패해도 다음 단계를 막지 않음 (사이트 하나가 실패해도 태깅/임베딩은 진행)
+    critical: bool = True
+
+
+SITES = {
+    "naver": naver.SITE,
+    "kakao": kakao.SITE,
+    "line": line.SITE,
+    "coupang": coupang.SITE,
+    "baemin": baemin.SITE,
+    "daangn": daangn.SITE,
+    "hpcnt": hpcnt.SITE,
+    "devsisters": devsisters.SITE,
+    "flipster": flipster.SITE,
+    "hyperithm": hyperithm.SITE,
+}
+
+# 수집에 성공한 사이트의 회사 이름 (태거는 이 회사들의 공고만 비활성화)
+scraped_companies: Set[str] = set()
+
+
+def scrape_site(site: Site) -> Callable[[], None]:
+    def run():
+        run_site(site)
+        scraped_companies.add(site.company_name)
+
+    return run
+
+
+def run_tagger():
+    # 실패한 사이트의 공고는 갱신되지 않았을 뿐이므로 비활성화하지 않음
+    tagger.main(companies=sorted(scraped_companies))
+
+
+STAGES = [
+    Stage("clear_chat_history", clear_chat_history.expire_chat_history),
+    Stage("drop_vector_index", drop_vector_index.drop_vector_index),
+    *[
+        Stage(name, scrape_site(site), deps=["drop_vector_index"], critical=False)
+        for name, site in SITES.items()
+    ],
+    Stage("tagger", run_tagger, deps=list(SITES)),
+    Stage("embedder", embedder.embed_and_store_sentences, deps=["tagger"]),
+    Stage(
+        "create_vector_index",
+        create_vector_index.create_vector_index,
+        deps=["embedder"],
+    ),
+]
+
+
+@dataclass
+class StageResult:
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def run_stage(stage: Stage) -> float:
+    threading.current_thread().name = stage.name
+    start_time = time.perf_counter()
+    stage.run()
+    return time.perf_counter() - start_time
+
+
+def run_pipeline(stages: List[Stage], max_workers: int) -> Dict[str, StageResult]:
+    """의존 관계가 모두 끝난 단계부터 한 프로세스 안에서 동시에 실행합니다."""
+    stages_by_name = {stage.name: stage for stage in stages}
+    results: Dict[str, StageResult] = {}
+    running: Dict[Future, Stage] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while len(results) < len(stages):
+            finished_count = len(results)
+            for stage in stages:
+                if stage.name in results or stage in running.values():
+                    continue
+                if not all(dep in results for dep in stage.deps):
+                    continue
+                blocked_by = [
+                    dep
+                    for dep in stage.deps
+                    if results[dep].status != "ok" and stages_by_name[dep].critical
+                ]
+                if blocked_by:
+                    results[stage.name] = StageResult(
+                        "skipped", error=f"실패한 선행 단계: {', '.join(blocked_by)}"
+                    )
+                    logging.warning(
+                        f"{stage.name} 건너뜀 ({', '.join(blocked_by)} 실패)"
+                    )
+                    continue
+                logging.info(f"{stage.name} 시작")
+                running[executor.submit(run_stage, stage)] = stage
+
+            if not running:
+                if len(results) > finished_count:
+                    continue
+                # 실행 중인 단계도 없고 더 진행할 수도 없으면 의존 관계가 잘못된 것
+                blocked = [
+                    f"{stage.name}({', '.join(d for d in stage.deps if d not in results)})"
+                    for stage in stages
+                    if stage.name not in results
+                ]
+                raise RuntimeError(f"시작할 수 없는 단계: {', '.join(blocked)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    seconds = future.result()
+                    results[stage.name] = StageResult("ok", seconds)
+                    logging.info(f"{stage.name} 완료 ({seconds:.1f}초)")
+                except Exception as e:
+                    results[stage.name] = StageResult("failed", error=str(e))
+                    logging.error(f"{stage.name} 실패: {e}")
+
+    return results
+
+
+def main():
+    start_time = time.perf_counter()
+    results = run_pipeline(STAGES, max_workers=len(SITES) + 1)
+    total_seconds = time.perf_counter() - start_time
+
+    logging.info("단계별 소요 시간")
+    for stage in STAGES:
+        result = results[stage.name]
+        detail = f"{result.seconds:.1f}초" if result.status == "ok" else result.error
+        logging.info(f"  {stage.name:<22} {result.status:<8} {detail}")
+    logging.info(f"전체 소요 시간: {total_seconds:.1f}초")
+
+    if any(results[stage.name].status != "ok" and stage.critical for stage in STAGES):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,8 @@
 import os
 import logging
 from dotenv import load_dotenv
-from typing import List
-import psycopg
-from util import DB_CONFIG
+from typing import List, Optional
+from util import db_connection
 
 load_dotenv(dotenv_path=".env.production")
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
@@ -201,8 +200,12 @@ def get_tag(job_title: str, company_name: str) -> List[str]:
     return tags
 
 
-def main():
-    with psycopg.connect(**DB_CONFIG) as conn:
+def main(companies: Optional[List[str]] = None):
+    """태그를 다시 매기고 오래 갱신되지 않은 공고를 비활성화합니다.
+
+    companies를 주면 그 회사의 공고만 비활성화하고, 없으면 전체를 대상으로 합니다.
+    """
+    with db_connection() as conn:
         all_tags = [
             "AI",
             "SRE",
@@ -245,6 +248,9 @@ def main():
             cur.execute("SELECT id, name FROM tags")
             tag_dict = {name: id for id, name in cur.fetchall()}
 
+            # 이번 실행에서 태그나 활성 상태가 바뀐 공고만 비정규화 테이블에 반영
+            changed_job_ids = set()
+
             for job_id, job_title, company_name in jobs:
                 job_title_lower = (job_title or "").lower()
                 tags = get_tag(job_title_lower, company_name)
@@ -255,19 +261,41 @@ def main():
                     tag_id = tag_dict.get(tag)
                     if tag_id:
                         cur.execute(
-                            "INSERT INTO job_tags (job_id, tag_id) VALUES (%s, %s) ON CONFLICT DO NOTHING",
+                            "INSERT INTO job_tags (job_id, tag_id) VALUES (%s, %s) ON CONFLICT DO NOTHING RETURNING job_id",
                             (job_id, tag_id),
                         )
+                        if cur.fetchone() is not None:
+                            changed_job_ids.add(job_id)
 
             conn.commit()
 
             cur.execute(
                 """
-                UPDATE job_info SET is_active = false WHERE updated_at < NOW() - INTERVAL '1 days'
-                """
+                UPDATE job_info SET is_active = false
+                WHERE is_active = true
+                  AND updated_at < NOW() - INTERVAL '1 days'
+                  AND (
+                    %(companies)s::text[] IS NULL
+                    OR company_id IN (
+                        SELECT id FROM companies WHERE name = ANY(%(companies)s)
+                    )
+                  )
+                RETURNING id
+                """,
+                {"companies": companies},
             )
+            changed_job_ids.update(row[0] for row in cur.fetchall())
             conn.commit()
 
+            # 새로 저장된 공고는 save_job_info가 이미 갱신했으므로 바뀐 공고만 갱신
+            if changed_job_ids:
+                cur.execute(
+                    "SELECT chapchap.refresh_job_read_model(%s)",
+                    (list(changed_job_ids),),
+                )
+                conn.commit()
+            logging.info(f"비정규화 테이블 갱신: {len(changed_job_ids)}건")
+
 
 if __name__ == "__main__":
     main()
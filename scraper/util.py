@@ -1,13 +1,20 @@
 import os
+import json
+import hashlib
 import logging
 from dotenv import load_dotenv
-from typing import List, Optional, Union
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
 from pydantic import BaseModel
 from google import genai
 from google.genai import types
 from datetime import date
-import psycopg
+from contextlib import contextmanager
+import atexit
+from psycopg_pool import ConnectionPool
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 load_dotenv(dotenv_path=".env.production")
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
@@ -22,6 +29,37 @@ DB_CONFIG = {
     "options": f"-c search_path={os.getenv('DB_SCHEMA', 'chapchap')}",
 }
 
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+
+_db_pool: Optional[ConnectionPool] = None
+_db_pool_lock = threading.Lock()
+
+
+def get_db_pool() -> ConnectionPool:
+    """프로세스 전체에서 공유하는 커넥션 풀을 반환합니다."""
+    global _db_pool
+    with _db_pool_lock:
+        if _db_pool is None:
+            _db_pool = ConnectionPool(
+                kwargs=DB_CONFIG, min_size=1, max_size=DB_POOL_SIZE, open=True
+            )
+            atexit.register(_db_pool.close)
+        return _db_pool
+
+
+@contextmanager
+def db_connection():
+    with get_db_pool().connection() as conn:
+        yield conn
+
+
+# --- Gemini 설정 ---
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "8"))
+GEMINI_RPM_LIMIT = int(os.getenv("GEMINI_RPM_LIMIT", "60"))
+GEMINI_TPM_LIMIT = int(os.getenv("GEMINI_TPM_LIMIT", "1000000"))
+# 응답 토큰은 미리 알 수 없으므로 예약할 때 이만큼 더해 둠
+EXTRACTION_OUTPUT_TOKENS = 1024
+
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
     "Referer": "https://www.coupang.jobs/",
@@ -42,7 +80,10 @@ class JobInfo(BaseModel):
     preferred_qualifications: List[str]
     hiring_process: List[str]
     additional_info: List[str]
-    uploaded_date: date
+    # 목록이나 상세 페이지에 게시일이 없으면 None (새 공고는 오늘, 기존 공고는 기존 값)
+    uploaded_date: Optional[date] = None
+    source_hash: Optional[str] = None
+    prompt_version: Optional[str] = None
 
 
 class JobInfoResponse(BaseModel):
@@ -55,14 +96,8 @@ class JobInfoResponse(BaseModel):
 
 
 # --- Gemini 추출 함수 ---
-def extract_structured_data_with_gemini(
-    company_name: str, job_content_text: str, api_key: str, model_type: str
-) -> Optional[JobInfoResponse]:
-    """Gemini API를 사용하여 구조화된 데이터를 추출합니다."""
-    try:
-        client = genai.Client(api_key=api_key)
-
-        prompt = f"""
+def build_extraction_prompt(company_name: str, job_content_text: str) -> str:
+    return f"""
 당신은 친절한 헤드헌터입니다.
 다음은 '{company_name}' 회사의 개발자 채용 공고 상세 내용 원본 텍스트입니다:
 
@@ -107,13 +142,130 @@ def extract_structured_data_with_gemini(
 - JSON 객체 외에 다른 부가적인 설명, 인사말, 코드 블록 마커(```json ... ```) 등은 절대 포함하지 마세요. 오직 순수한 JSON 객체만 출력해야 합니다.
 """
 
-        max_retries = 3
-        retry_count = 0
 
-        while retry_count < max_retries:
+def extraction_prompt_version(model_type: str) -> str:
+    """프롬프트, 응답 스키마, 모델 중 하나라도 바뀌면 달라지는 버전 문자열."""
+    fingerprint = "\n".join(
+        [
+            build_extraction_prompt("", ""),
+            json.dumps(JobInfoResponse.model_json_schema(), sort_keys=True),
+            model_type,
+        ]
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+def source_text_hash(company_name: str, job_title: str, job_content_text: str) -> str:
+    """공백 차이를 무시한 원본 텍스트의 해시. 제목도 저장되므로 함께 포함합니다."""
+    normalized = " ".join(job_content_text.split())
+    source = f"{company_name}\n{job_title}\n{normalized}"
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 2
+
+
+class RateLimiter:
+    """최근 1분 동안 시작한 요청 수와 토큰 수를 제한합니다 (스레드 안전).
+
+    요청 전에 예상 토큰으로 자리를 잡고, 응답 후 실제 사용량으로 보정합니다.
+    """
+
+    def __init__(self, rpm: int, tpm: int, window: float = 60.0):
+        self._rpm = rpm
+        self._tpm = tpm
+        self._window = window
+        self._entries: Deque[list] = deque()  # [시작 시각, 토큰 수, 집계 여부]
+        self._tokens = 0
+        self._cond = threading.Condition()
+
+    def _expire(self, now: float):
+        while self._entries and now - self._entries[0][0] >= self._window:
+            entry = self._entries.popleft()
+            self._tokens -= entry[1]
+            entry[2] = False
+
+    def acquire(self, tokens: int) -> Tuple[list, float]:
+        """자리가 날 때까지 기다린 뒤 (예약 항목, 대기 시간)을 반환합니다."""
+        start_time = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                # 한도보다 큰 요청도 창이 비면 보냄
+                if len(self._entries) < self._rpm and (
+                    self._tokens + tokens <= self._tpm or not self._entries
+                ):
+                    entry = [now, tokens, True]
+                    self._entries.append(entry)
+                    self._tokens += tokens
+                    return entry, now - start_time
+                self._cond.wait(self._window - (now - self._entries[0][0]))
+
+    def settle(self, entry: list, tokens: int):
+        with self._cond:
+            if entry[2]:
+                self._tokens += tokens - entry[1]
+                entry[1] = tokens
+                self._cond.notify_all()
+
+
+class GeminiExtractionPool:
+    """모든 사이트가 공유하는 Gemini 추출 풀.
+
+    클라이언트 하나를 재사용하고, 동시 호출 수를 GEMINI_CONCURRENCY로 제한하며,
+    재시도를 포함한 모든 호출이 프로세스 전체의 분당 요청/토큰 한도를 나눠 씁니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model_type: str,
+        concurrency: int,
+        rpm: int,
+        tpm: int,
+        max_retries: int = 3,
+    ):
+        self._client = genai.Client(api_key=api_key)
+        self._model_type = model_type
+        self.prompt_version = extraction_prompt_version(model_type)
+        self._max_retries = max_retries
+        self._limiter = RateLimiter(rpm, tpm)
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="gemini"
+        )
+        self._stats_lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._stats = {
+            "extractions": 0,
+            "failures": 0,
+            "retries": 0,
+            "prompt_tokens": 0,
+            "output_tokens": 0,
+            "throttled_seconds": 0.0,
+        }
+
+    def _record(self, **deltas):
+        with self._stats_lock:
+            for key, value in deltas.items():
+                self._stats[key] += value
+
+    def submit(self, company_name: str, job_content_text: str) -> Future:
+        return self._executor.submit(self.extract, company_name, job_content_text)
+
+    def extract(
+        self, company_name: str, job_content_text: str
+    ) -> Optional[JobInfoResponse]:
+        """Gemini API를 사용하여 구조화된 데이터를 추출합니다."""
+        prompt = build_extraction_prompt(company_name, job_content_text)
+        estimated_tokens = estimate_tokens(prompt) + EXTRACTION_OUTPUT_TOKENS
+        for attempt in range(1, self._max_retries + 1):
+            entry, waited = self._limiter.acquire(estimated_tokens)
+            self._record(throttled_seconds=waited)
             try:
-                response = client.models.generate_content(
-                    model=model_type,
+                response = self._client.models.generate_content(
+                    model=self._model_type,
                     contents=prompt,
                     config=types.GenerateContentConfig(
                         response_mime_type="application/json",
@@ -121,19 +273,73 @@ def extract_structured_data_with_gemini(
                         response_schema=JobInfoResponse,
                     ),
                 )
-                return response.parsed
             except Exception as e:
-                retry_count += 1
-                if retry_count == max_retries:
-                    raise e
-                logging.warning(
-                    f"Gemini API 호출 {retry_count}번째 재시도 중... 에러: {e}"
-                )
+                if attempt == self._max_retries:
+                    logging.error(f"Gemini 호출 실패: {e}")
+                    self._record(failures=1)
+                    return None
+                logging.warning(f"Gemini API 호출 {attempt}번째 재시도 중... 에러: {e}")
+                self._record(retries=1)
                 time.sleep(1)
-
-    except Exception as e:
-        logging.error(f"Gemini 호출 실패: {e}")
-        return None
+                continue
+
+            usage = response.usage_metadata
+            prompt_tokens = (usage and usage.prompt_token_count) or 0
+            output_tokens = (usage and usage.candidates_token_count) or 0
+            if usage and usage.total_token_count:
+                self._limiter.settle(entry, usage.total_token_count)
+            self._record(
+                extractions=1,
+                prompt_tokens=prompt_tokens,
+                output_tokens=output_tokens,
+            )
+            return response.parsed
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        minutes = max(time.monotonic() - self._started_at, 1e-9) / 60
+        stats["extractions_per_minute"] = round(stats["extractions"] / minutes, 1)
+        stats["tokens_per_minute"] = round(
+            (stats["prompt_tokens"] + stats["output_tokens"]) / minutes
+        )
+        return stats
+
+    def log_stats(self):
+        stats = self.stats()
+        logging.info(
+            f"Gemini 추출 {stats['extractions']}건 (실패 {stats['failures']}건, "
+            f"재시도 {stats['retries']}회), 분당 {stats['extractions_per_minute']}건, "
+            f"분당 {stats['tokens_per_minute']} 토큰, "
+            f"한도 대기 {stats['throttled_seconds']:.1f}초"
+        )
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.log_stats()
+
+
+_extraction_pool: Optional[GeminiExtractionPool] = None
+_extraction_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> GeminiExtractionPool:
+    """프로세스 전체에서 공유하는 Gemini 추출 풀을 반환합니다."""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            api_key, model_type = get_env_vars(
+                "GOOGLE_API_KEY", "GEMINI_SYNTHETIC_DATA_GENERATION_MODEL"
+            )
+            _extraction_pool = GeminiExtractionPool(
+                api_key,
+                model_type,
+                concurrency=GEMINI_CONCURRENCY,
+                rpm=GEMINI_RPM_LIMIT,
+                tpm=GEMINI_TPM_LIMIT,
+            )
+            atexit.register(_extraction_pool.close)
+        return _extraction_pool
 
 
 # --- 유틸 함수 ---
@@ -148,6 +354,79 @@ def get_env_vars(*var_names: str) -> Union[str, tuple]:
     return tuple(values) if len(values) > 1 else values[0]
 
 
+def find_unchanged_jobs(jobs: List[Dict], prompt_version: str) -> Set[str]:
+    """목록 정보(제목, 게시일)와 프롬프트 버전이 저장된 값과 같은 링크를 반환합니다."""
+    with db_connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT link, job_title, uploaded_date, prompt_version
+            FROM chapchap.job_info
+            WHERE link = ANY(%s)
+            """,
+            ([job["link"] for job in jobs],),
+        ).fetchall()
+
+    stored = {link: rest for link, *rest in rows}
+    unchanged = set()
+    for job in jobs:
+        if job["link"] not in stored:
+            continue
+        job_title, uploaded_date, version = stored[job["link"]]
+        # 목록에 게시일이 없는 사이트는 제목과 프롬프트 버전만 비교
+        if (
+            job_title == job["title"]
+            and version == prompt_version
+            and job.get("uploaded_date") in (None, uploaded_date)
+        ):
+            unchanged.add(job["link"])
+    return unchanged
+
+
+def touch_jobs(links: List[str]):
+    """공고들의 updated_at을 한 번에 갱신합니다."""
+    with db_connection() as conn:
+        job_ids = [
+            row[0]
+            for row in conn.execute(
+                """
+                UPDATE chapchap.job_info SET updated_at = NOW()
+                WHERE link = ANY(%s)
+                RETURNING id
+                """,
+                (links,),
+            ).fetchall()
+        ]
+        # API 조회용 비정규화 테이블도 같은 트랜잭션에서 갱신
+        conn.execute("SELECT chapchap.refresh_job_read_model(%s)", (job_ids,))
+        conn.commit()
+
+
+def touch_unchanged_job(
+    link: str,
+    source_hash: str,
+    prompt_version: str,
+    uploaded_date: Optional[date] = None,
+) -> bool:
+    """같은 원본과 프롬프트로 추출된 공고면 updated_at과 게시일만 갱신합니다."""
+    with db_connection() as conn:
+        cur = conn.execute(
+            """
+            UPDATE chapchap.job_info SET
+                updated_at = NOW(),
+                uploaded_date = COALESCE(%s, uploaded_date)
+            WHERE link = %s AND source_hash = %s AND prompt_version = %s
+            RETURNING id
+            """,
+            (uploaded_date, link, source_hash, prompt_version),
+        )
+        row = cur.fetchone()
+        if row is not None:
+            # 게시일이 바뀌었을 수 있으므로 API 조회용 비정규화 테이블도 갱신
+            conn.execute("SELECT chapchap.refresh_job_read_model(%s)", ([row[0]],))
+        conn.commit()
+    return row is not None
+
+
 def save_job_info(
     job_info: JobInfo, alternate_names: List[str], test_mode: bool = False
 ):
@@ -167,7 +446,7 @@ def save_job_info(
     ):
         return
 
-    with psycopg.connect(**DB_CONFIG) as conn:
+    with db_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(f"SET search_path TO {os.getenv('DB_SCHEMA', 'chapchap')}")
             # 회사 ID 가져오기 또는 삽입
@@ -225,6 +504,9 @@ def save_job_info(
                             responsibilities       = %s,
                             hiring_process         = %s,
                             additional_info        = %s,
+                            uploaded_date          = COALESCE(%s, uploaded_date),
+                            source_hash            = %s,
+                            prompt_version         = %s,
                             updated_at             = NOW()
                         WHERE link = %s
                         """,
@@ -236,6 +518,9 @@ def save_job_info(
                         job_info.responsibilities,
                         job_info.hiring_process,
                         job_info.additional_info,
+                        job_info.uploaded_date,
+                        job_info.source_hash,
+                        job_info.prompt_version,
                         job_info.link,
                     ),
                 )
@@ -251,9 +536,12 @@ def save_job_info(
                             responsibilities,
                             hiring_process,
                             additional_info,
-                            uploaded_date
+                            uploaded_date,
+                            source_hash,
+                            prompt_version
                         ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s
+                            %s, %s, %s, %s, %s, %s, %s, %s,
+                            COALESCE(%s, CURRENT_DATE), %s, %s
                         )
                         """,
                     (
@@ -266,6 +554,8 @@ def save_job_info(
                         job_info.hiring_process,
                         job_info.additional_info,
                         job_info.uploaded_date,
+                        job_info.source_hash,
+                        job_info.prompt_version,
                     ),
                 )
 
@@ -300,4 +590,10 @@ def save_job_info(
                 qualification_sentences,
             )
 
+            # API 조회용 비정규화 테이블 갱신
+            cur.execute(
+                "SELECT chapchap.refresh_job_read_model(%s)",
+                ([job_id],),
+            )
+
             conn.commit()
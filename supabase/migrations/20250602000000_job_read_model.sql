@@ -0,0 +1,140 @@
+-- Denormalized read model: one row per job with company names, tags and qualifications.
+-- Refreshed by the scraper (save_job_info, tagger) via chapchap.refresh_job_read_model().
+CREATE TABLE chapchap.job_read_model (
+    id UUID PRIMARY KEY REFERENCES chapchap.job_info(id) ON DELETE CASCADE,
+    job_title TEXT NOT NULL,
+    company_id INT NOT NULL,
+    affiliate_company_id INT NOT NULL,
+    link TEXT NOT NULL,
+    team_info TEXT NOT NULL,
+    responsibilities TEXT[] NOT NULL,
+    hiring_process TEXT[] NOT NULL,
+    additional_info TEXT[] NOT NULL,
+    uploaded_date DATE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    is_active BOOLEAN,
+    company_name TEXT NOT NULL,
+    affiliate_company_name TEXT NOT NULL,
+    parent_company_name TEXT NOT NULL,
+    tags TEXT[] NOT NULL DEFAULT '{}',
+    qualifications TEXT[] NOT NULL DEFAULT '{}',
+    preferred_qualifications TEXT[] NOT NULL DEFAULT '{}',
+    refreshed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX idx_job_read_model_is_active ON chapchap.job_read_model(is_active);
+CREATE INDEX idx_job_read_model_active_uploaded_date_id
+    ON chapchap.job_read_model (uploaded_date DESC, id DESC)
+    WHERE is_active = true;
+CREATE INDEX idx_job_read_model_company_name ON chapchap.job_read_model(company_name);
+CREATE INDEX idx_job_read_model_affiliate_company_name ON chapchap.job_read_model(affiliate_company_name);
+CREATE INDEX idx_job_read_model_tags ON chapchap.job_read_model USING gin (tags);
+CREATE INDEX idx_job_read_model_refreshed_at ON chapchap.job_read_model(refreshed_at DESC);
+
+CREATE OR REPLACE FUNCTION chapchap.refresh_job_read_model(job_ids UUID[] DEFAULT NULL)
+RETURNS void
+LANGUAGE sql
+AS $$
+    INSERT INTO chapchap.job_read_model (
+        id,
+        job_title,
+        company_id,
+        affiliate_company_id,
+        link,
+        team_info,
+        responsibilities,
+        hiring_process,
+        additional_info,
+        uploaded_date,
+        created_at,
+        updated_at,
+        is_active,
+        company_name,
+        affiliate_company_name,
+        parent_company_name,
+        tags,
+        qualifications,
+        preferred_qualifications,
+        refreshed_at
+    )
+    SELECT
+        j.id,
+        j.job_title,
+        j.company_id,
+        j.affiliate_company_id,
+        j.link,
+        j.team_info,
+        j.responsibilities,
+        j.hiring_process,
+        j.additional_info,
+        j.uploaded_date,
+        j.created_at,
+        j.updated_at,
+        j.is_active,
+        c.name,
+        ac.name,
+        pc.name,
+        ARRAY(
+            SELECT t.name
+            FROM chapchap.job_tags jt
+            JOIN chapchap.tags t ON jt.tag_id = t.id
+            WHERE jt.job_id = j.id
+            ORDER BY t.id
+        ),
+        ARRAY(
+            SELECT s.sentence
+            FROM chapchap.job_qualification_sentences s
+            WHERE s.job_id = j.id AND s.type = 'required'
+            ORDER BY s.sentence_index
+        ),
+        ARRAY(
+            SELECT s.sentence
+            FROM chapchap.job_qualification_sentences s
+            WHERE s.job_id = j.id AND s.type = 'preferred'
+            ORDER BY s.sentence_index
+        ),
+        NOW()
+    FROM chapchap.job_info j
+    JOIN chapchap.companies c ON j.company_id = c.id
+    JOIN chapchap.affiliate_companies ac ON j.affiliate_company_id = ac.id
+    JOIN chapchap.companies pc ON ac.parent_company_id = pc.id
+    WHERE job_ids IS NULL OR j.id = ANY(job_ids)
+    ON CONFLICT (id) DO UPDATE SET
+        job_title = EXCLUDED.job_title,
+        company_id = EXCLUDED.company_id,
+        affiliate_company_id = EXCLUDED.affiliate_company_id,
+        link = EXCLUDED.link,
+        team_info = EXCLUDED.team_info,
+        responsibilities = EXCLUDED.responsibilities,
+        hiring_process = EXCLUDED.hiring_process,
+        additional_info = EXCLUDED.additional_info,
+        uploaded_date = EXCLUDED.uploaded_date,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at,
+        is_active = EXCLUDED.is_active,
+        company_name = EXCLUDED.company_name,
+        affiliate_company_name = EXCLUDED.affiliate_company_name,
+        parent_company_name = EXCLUDED.parent_company_name,
+        tags = EXCLUDED.tags,
+        qualifications = EXCLUDED.qualifications,
+        preferred_qualifications = EXCLUDED.preferred_qualifications,
+        refreshed_at = EXCLUDED.refreshed_at;
+$$;
+
+SELECT chapchap.refresh_job_read_model();
+
+ALTER TABLE chapchap.job_read_model ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Allow public read access" ON chapchap.job_read_model
+    FOR SELECT
+    USING (true);
+CREATE POLICY "Allow authenticated users to insert" ON chapchap.job_read_model
+    FOR INSERT
+    TO authenticated
+    WITH CHECK (true);
+CREATE POLICY "Allow authenticated users to update" ON chapchap.job_read_model
+    FOR UPDATE
+    TO authenticated
+    USING (true)
+    WITH CHECK (true);
@@ -0,0 +1,11 @@
+-- Sentence embedding cache for the API, keyed by (model, sha256 of the sentence).
+-- Vectors are stored as packed little-endian float32 bytes.
+CREATE TABLE chapchap.embedding_cache (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    embedding BYTEA NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (model, text_hash)
+);
+
+ALTER TABLE chapchap.embedding_cache ENABLE ROW LEVEL SECURITY;
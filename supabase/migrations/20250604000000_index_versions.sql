@@ -0,0 +1,12 @@
+-- Version counters published by the scraper so the API can hot-reload in-memory indexes.
+CREATE TABLE chapchap.index_versions (
+    name TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    published_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+ALTER TABLE chapchap.index_versions ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Allow public read access" ON chapchap.index_versions
+    FOR SELECT
+    USING (true);
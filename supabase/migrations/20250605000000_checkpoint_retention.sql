@@ -0,0 +1,77 @@
+-- Session registry for the LangGraph checkpoint tables created by the API's
+-- AsyncPostgresSaver. Every upload resets its thread and records when it started,
+-- so expired threads can be deleted in small batches instead of a global purge.
+CREATE TABLE chapchap.checkpoint_threads (
+    thread_id TEXT PRIMARY KEY,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_checkpoint_threads_created_at ON chapchap.checkpoint_threads (created_at);
+
+ALTER TABLE chapchap.checkpoint_threads ENABLE ROW LEVEL SECURITY;
+
+-- The checkpoint tables are created by the API at startup, so the function bodies
+-- are PL/pgSQL and only resolved when they are called.
+CREATE OR REPLACE FUNCTION chapchap.delete_checkpoint_threads(thread_ids TEXT[])
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM chapchap.checkpoint_blobs WHERE thread_id = ANY(thread_ids);
+    DELETE FROM chapchap.checkpoint_writes WHERE thread_id = ANY(thread_ids);
+    DELETE FROM chapchap.checkpoints WHERE thread_id = ANY(thread_ids);
+END;
+$$;
+
+-- Clears a session's checkpoints and restarts its retention clock in one call.
+CREATE OR REPLACE FUNCTION chapchap.reset_checkpoint_thread(session_id TEXT)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM chapchap.delete_checkpoint_threads(ARRAY[session_id]);
+    INSERT INTO chapchap.checkpoint_threads (thread_id, created_at)
+    VALUES (session_id, NOW())
+    ON CONFLICT (thread_id) DO UPDATE SET created_at = EXCLUDED.created_at;
+END;
+$$;
+
+-- Deletes up to batch_size threads older than ttl and returns how many were expired.
+-- SKIP LOCKED lets several sweepers run without waiting on each other.
+CREATE OR REPLACE FUNCTION chapchap.expire_checkpoint_threads(ttl INTERVAL, batch_size INT)
+RETURNS INT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    expired_ids TEXT[];
+BEGIN
+    SELECT ARRAY_AGG(thread_id) INTO expired_ids
+    FROM (
+        SELECT thread_id
+        FROM chapchap.checkpoint_threads
+        WHERE created_at < NOW() - ttl
+        ORDER BY created_at
+        LIMIT batch_size
+        FOR UPDATE SKIP LOCKED
+    ) expired;
+
+    IF expired_ids IS NULL THEN
+        RETURN 0;
+    END IF;
+
+    PERFORM chapchap.delete_checkpoint_threads(expired_ids);
+    DELETE FROM chapchap.checkpoint_threads WHERE thread_id = ANY(expired_ids);
+    RETURN CARDINALITY(expired_ids);
+END;
+$$;
+
+-- Register threads that already exist so they expire like new ones.
+DO $$
+BEGIN
+    IF to_regclass('chapchap.checkpoints') IS NOT NULL THEN
+        INSERT INTO chapchap.checkpoint_threads (thread_id)
+        SELECT DISTINCT thread_id FROM chapchap.checkpoints
+        ON CONFLICT (thread_id) DO NOTHING;
+    END IF;
+END;
+$$;
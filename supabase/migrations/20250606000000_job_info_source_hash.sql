@@ -0,0 +1,5 @@
+-- Fingerprint of the text each posting was extracted from. The scraper skips the
+-- Gemini extraction and only refreshes updated_at when both values still match.
+ALTER TABLE chapchap.job_info
+    ADD COLUMN source_hash TEXT,
+    ADD COLUMN prompt_version TEXT;